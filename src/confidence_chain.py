@@ -1,25 +1,91 @@
 """Confidence scoring for action items."""
 
-from typing import List
-from langchain_openai import ChatOpenAI
-from src.models import ActionItem
-from src.config import get_logger, OPENAI_MODEL
+import asyncio
+import time
+from typing import List, Optional
+from openai import OpenAI
+from src.json_utils import find_json_block
+from src.llm_cache import get_llm_cache
+from src.llm_client import get_chat_llm
+from src.models import ActionItem, UNASSIGNED_OWNER
+from src.config import get_logger, OPENAI_MODEL, MAX_CONCURRENCY
 import json
+import orjson
 
 
 logger = get_logger(__name__)
 
+BATCH_POLL_SECONDS = 30
+SCORE_GROUP_SIZE = 20  # Items scored per LLM call in score_all
+
+# Items with an explicit owner, a deadline and a descriptive task skip the LLM
+HEURISTIC_CONFIDENCE = 0.9
+HEURISTIC_MIN_TASK_WORDS = 4
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
 
 class ConfidenceChain:
     """Score confidence of action items."""
     
-    def __init__(self, model_name: str = OPENAI_MODEL):
-        """Initialize the confidence scorer."""
+    def __init__(
+        self,
+        model_name: str = OPENAI_MODEL,
+        max_concurrency: int = MAX_CONCURRENCY,
+        use_batch_api: bool = False
+    ):
+        """
+        Initialize the confidence scorer.
+        
+        Args:
+            model_name: OpenAI model to score with
+            max_concurrency: Maximum concurrent scoring requests
+            use_batch_api: Submit scoring through the OpenAI Batch API (cheaper, but
+                results can take minutes to hours)
+        """
         self.model_name = model_name
-        self.llm = ChatOpenAI(model=model_name, temperature=0.1)
+        self.max_concurrency = max_concurrency
+        self.use_batch_api = use_batch_api
+        self.temperature = 0.1
+        self.llm = get_chat_llm(model_name, self.temperature)
+        self.cache = get_llm_cache()
         
         logger.info(f"Initialized Confidence chain with model: {model_name}")
     
+    def _build_prompt(self, item: ActionItem) -> str:
+        """Build the confidence prompt for a single item."""
+        return f"""
+        Rate your confidence (0.0-1.0) that this is a genuine, actionable task from a meeting:
+        
+        Task: {item.task}
+        Owner: {item.owner}
+        Deadline: {item.deadline}
+        
+        Consider:
+        - How explicit is the task?
+        - How clear is the owner?
+        - How specific is the deadline?
+        
+        Return ONLY a number between 0.0 and 1.0.
+        """
+    
+    @staticmethod
+    def _is_score(score_text: str) -> bool:
+        """Whether a single-item response parses as a score (only those are cached)."""
+        try:
+            float(score_text)
+            return True
+        except ValueError:
+            return False
+    
+    def _parse_score(self, item: ActionItem, score_text: str) -> float:
+        """Parse and clamp an LLM score, falling back to the item's current confidence."""
+        try:
+            score = float(score_text)
+            return max(0.0, min(1.0, score))  # Clamp to 0-1
+        except ValueError:
+            logger.warning(f"Failed to parse confidence score: {score_text}")
+            return item.confidence  # Return original if parsing fails
+    
     def score_confidence(self, item: ActionItem) -> float:
         """
         Score confidence of a single action item.
@@ -30,40 +96,255 @@ class ConfidenceChain:
         Returns:
             Confidence score 0-1
         """
-        prompt = f"""
-        Rate your confidence (0.0-1.0) that this is a genuine, actionable task from a meeting:
+        try:
+            score_text = self.cache.invoke(
+                self.llm, self.model_name, self._build_prompt(item), valid=self._is_score
+            )
+            return self._parse_score(item, score_text.strip())
+        except AttributeError:
+            logger.warning("Failed to read confidence score from response")
+            return item.confidence
+    
+    async def _ascore(self, item: ActionItem, semaphore: asyncio.Semaphore) -> float:
+        """Score a single item asynchronously, bounded by the shared semaphore."""
+        prompt = self._build_prompt(item)
         
-        Task: {item.task}
-        Owner: {item.owner}
-        Deadline: {item.deadline}
+        async with semaphore:
+            score_text = await self.cache.ainvoke(self.llm, self.model_name, prompt, valid=self._is_score)
+        
+        return self._parse_score(item, score_text.strip())
+    
+    async def ascore_batch(self, items: List[ActionItem]) -> List[ActionItem]:
+        """
+        Score confidence for multiple items concurrently.
+        
+        Args:
+            items: List of ActionItem objects to score
+            
+        Returns:
+            The same items with updated confidence scores
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        logger.info(f"Scoring {len(items)} items (max {self.max_concurrency} concurrent requests)")
+        
+        scores = await asyncio.gather(
+            *[self._ascore(item, semaphore) for item in items],
+            return_exceptions=True
+        )
+        
+        for item, score in zip(items, scores):
+            if isinstance(score, Exception):
+                logger.warning(f"Failed to score item '{item.task}': {score}")
+                continue
+            item.confidence = score
+        
+        return items
+    
+    def _build_group_prompt(self, items: List[ActionItem]) -> str:
+        """Build a prompt asking for one confidence score per item, as a JSON array."""
+        items_json = orjson.dumps(
+            [{"task": item.task, "owner": item.owner, "deadline": item.deadline} for item in items]
+        ).decode()
+        
+        return f"""
+        Rate your confidence (0.0-1.0) that each of these is a genuine, actionable task from a meeting:
+        
+        {items_json}
         
         Consider:
         - How explicit is the task?
         - How clear is the owner?
         - How specific is the deadline?
         
-        Return ONLY a number between 0.0 and 1.0.
+        Return ONLY a JSON array of {len(items)} numbers between 0.0 and 1.0, in the same order.
         """
+    
+    @staticmethod
+    def _parse_group_scores(response_text: str, expected: int) -> List[Optional[float]]:
+        """Parse a JSON array of scores; unparseable positions come back as None."""
+        json_str = find_json_block(response_text, "[")
         
         try:
-            response = self.llm.invoke(prompt)
-            score_text = response.content.strip()
+            scores = orjson.loads(json_str) if json_str is not None else None
+        except orjson.JSONDecodeError:
+            scores = None
+        
+        if not isinstance(scores, list) or len(scores) != expected:
+            logger.warning(f"Expected {expected} confidence scores, got: {response_text[:100]}")
+            return [None] * expected
+        
+        parsed = []
+        for score in scores:
+            try:
+                parsed.append(max(0.0, min(1.0, float(score))))  # Clamp to 0-1
+            except (TypeError, ValueError):
+                parsed.append(None)
+        return parsed
+    
+    async def _ascore_group(self, items: List[ActionItem], semaphore: asyncio.Semaphore) -> List[Optional[float]]:
+        """Score a group of items with a single LLM call."""
+        prompt = self._build_group_prompt(items)
+        
+        async with semaphore:
+            response_text = await self.cache.ainvoke(
+                self.llm, self.model_name, prompt,
+                valid=lambda text: None not in self._parse_group_scores(text, len(items))
+            )
+        
+        return self._parse_group_scores(response_text, len(items))
+    
+    async def ascore_all(self, items: List[ActionItem]) -> List[ActionItem]:
+        """
+        Score confidence for multiple items using one LLM call per group of items.
+        
+        Groups of SCORE_GROUP_SIZE items are scored concurrently; items whose
+        score could not be parsed fall back to individual scoring.
+        
+        Args:
+            items: List of ActionItem objects to score
             
-            # Try to parse as float
-            score = float(score_text)
-            return max(0.0, min(1.0, score))  # Clamp to 0-1
+        Returns:
+            The same items with updated confidence scores
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        groups = [items[i:i + SCORE_GROUP_SIZE] for i in range(0, len(items), SCORE_GROUP_SIZE)]
+        logger.info(f"Scoring {len(items)} items in {len(groups)} grouped requests")
         
-        except (ValueError, AttributeError):
-            logger.warning(f"Failed to parse confidence score: {score_text}")
-            return item.confidence  # Return original if parsing fails
+        group_scores = await asyncio.gather(
+            *[self._ascore_group(group, semaphore) for group in groups],
+            return_exceptions=True
+        )
+        
+        retry_items = []
+        for group, scores in zip(groups, group_scores):
+            if isinstance(scores, Exception):
+                logger.warning(f"Grouped scoring failed: {scores}")
+                scores = [None] * len(group)
+            
+            for item, score in zip(group, scores):
+                if score is None:
+                    retry_items.append(item)
+                else:
+                    item.confidence = score
+        
+        if retry_items:
+            logger.info(f"Falling back to individual scoring for {len(retry_items)} items")
+            await self.ascore_batch(retry_items)
+        
+        return items
     
-    def score_batch(self, items: List[ActionItem]) -> List[ActionItem]:
-        """Score confidence for multiple items."""
-        scored_items = []
+    def score_all(self, items: List[ActionItem]) -> List[ActionItem]:
+        """Score confidence for multiple items using grouped LLM calls."""
+        return asyncio.run(self.ascore_all(items))
+    
+    def score_with_batch_api(self, items: List[ActionItem]) -> List[ActionItem]:
+        """
+        Score confidence for multiple items through the OpenAI Batch API.
+        
+        Submits one JSONL request per item, polls until the batch finishes and
+        maps the results back by custom_id. Items whose request fails keep
+        their current confidence.
+        
+        Args:
+            items: List of ActionItem objects to score
+            
+        Returns:
+            The same items with updated confidence scores
+        """
+        client = OpenAI()
+        
+        requests = [
+            json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model_name,
+                    "temperature": self.temperature,
+                    "messages": [{"role": "user", "content": self._build_prompt(item)}],
+                },
+            })
+            for i, item in enumerate(items)
+        ]
+        
+        batch_file = client.files.create(
+            file=("confidence_batch.jsonl", "\n".join(requests).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Submitted confidence batch {batch.id} with {len(items)} items")
+        
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            time.sleep(BATCH_POLL_SECONDS)
+            batch = client.batches.retrieve(batch.id)
+            logger.debug(f"Confidence batch {batch.id} status: {batch.status}")
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            logger.warning(f"Confidence batch {batch.id} ended with status: {batch.status}")
+            return items
         
-        for i, item in enumerate(items):
-            logger.info(f"Scoring item {i + 1}/{len(items)}")
-            item.confidence = self.score_confidence(item)
-            scored_items.append(item)
+        output = client.files.content(batch.output_file_id).text
         
-        return scored_items
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            
+            result = json.loads(line)
+            item = items[int(result["custom_id"])]
+            
+            if result.get("error"):
+                logger.warning(f"Failed to score item '{item.task}': {result['error']}")
+                continue
+            
+            content = result["response"]["body"]["choices"][0]["message"]["content"]
+            item.confidence = self._parse_score(item, content.strip())
+        
+        return items
+    
+    @staticmethod
+    def _is_clear_cut(item: ActionItem) -> bool:
+        """Whether an item is explicit enough to score without the LLM."""
+        return (
+            bool(item.owner.strip())
+            and item.owner != UNASSIGNED_OWNER
+            and bool(item.deadline)
+            and len(item.task.split()) >= HEURISTIC_MIN_TASK_WORDS
+        )
+    
+    async def ascore_items(self, items: List[ActionItem]) -> List[ActionItem]:
+        """
+        Score confidence for multiple items.
+        
+        Clear-cut items (named owner, deadline, descriptive task) get a fixed
+        high score; only the remaining items are sent to the LLM.
+        
+        Args:
+            items: List of ActionItem objects to score
+            
+        Returns:
+            The same items with updated confidence scores
+        """
+        to_score = []
+        for item in items:
+            if self._is_clear_cut(item):
+                item.confidence = HEURISTIC_CONFIDENCE
+            else:
+                to_score.append(item)
+        
+        logger.info(f"Scored {len(items) - len(to_score)} clear-cut items without the LLM")
+        
+        if to_score:
+            if self.use_batch_api:
+                await asyncio.to_thread(self.score_with_batch_api, to_score)
+            else:
+                await self.ascore_all(to_score)
+        
+        return items
+    
+    def score_batch(self, items: List[ActionItem]) -> List[ActionItem]:
+        """Score confidence for multiple items (see ascore_items)."""
+        return asyncio.run(self.ascore_items(items))
@@ -1,6 +1,9 @@
 """Configuration management for the project."""
 
 import os
+import sys
+import yaml
+from functools import lru_cache
 from dotenv import load_dotenv
 from loguru import logger
 
@@ -10,11 +13,13 @@ load_dotenv()
 # API Configuration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4")
+OPENAI_JSON_MODE = os.getenv("OPENAI_JSON_MODE", "false").lower() == "true"  # Requires a model with JSON mode
 
 # Project Settings
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 BATCH_SIZE = int(os.getenv("BATCH_SIZE", "10"))
 CONFIDENCE_THRESHOLD = float(os.getenv("CONFIDENCE_THRESHOLD", "0.4"))
+MAX_CONCURRENCY = int(os.getenv("MAX_CONCURRENCY", "5"))  # Concurrent LLM requests
 
 # Chunking Settings
 CHUNK_STRATEGY = "speaker_turns"  # or "time_based"
@@ -29,6 +34,13 @@ MAX_TOKENS = 1000
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(PROJECT_ROOT, "data")
 OUTPUT_DIR = os.path.join(DATA_DIR, "outputs")
+PROMPTS_DIR = os.path.join(PROJECT_ROOT, "src", "prompts")
+
+# LLM Response Cache
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", os.path.join(DATA_DIR, "cache.jsonl"))
+LLM_CACHE_SEMANTIC = os.getenv("LLM_CACHE_SEMANTIC", "false").lower() == "true"  # Embedding-similarity lookup
+LLM_CACHE_SIMILARITY = 0.97
 
 # Create directories if they don't exist
 os.makedirs(OUTPUT_DIR, exist_ok=True)
@@ -36,8 +48,9 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 # Configure logging
 logger.remove()
 logger.add(
-    lambda msg: print(msg, end=""),
+    sys.stderr,
     level=LOG_LEVEL,
+    enqueue=True,  # Write from a background thread so concurrent LLM calls don't block on logging
     format="<level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
 )
 
@@ -49,3 +62,10 @@ if not OPENAI_API_KEY:
 def get_logger(name: str):
     """Get a configured logger."""
     return logger.bind(name=name)
+
+
+@lru_cache(maxsize=None)
+def load_prompt(filename: str) -> dict:
+    """Load and parse a prompt config from the prompts directory (cached per file)."""
+    with open(os.path.join(PROMPTS_DIR, filename), "r") as f:
+        return yaml.safe_load(f)
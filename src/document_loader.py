@@ -1,180 +1,271 @@
 """Document loading and chunking utilities for transcripts."""
 
-from typing import List, Dict, Optional
+import io
+import itertools
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+import tiktoken
 from langchain.schema import Document
 from src.models import TranscriptMetadata
-from src.config import get_logger, CHUNK_SIZE_MINUTES, MAX_CHUNK_TOKENS
+from src.config import get_logger, CHUNK_SIZE_MINUTES, MAX_CHUNK_TOKENS, OPENAI_MODEL
 
 
 logger = get_logger(__name__)
 
 
+# Rough characters per token, used when the tiktoken vocabulary can't be loaded
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=None)
+def _token_counter() -> Callable[[str], int]:
+    """
+    Token counter for the configured model (loaded once, on first use).
+    
+    tiktoken downloads its vocabulary the first time an encoding is used; if
+    that fails (e.g. no network access), token counts are estimated from the
+    text length instead so chunking still works offline.
+    """
+    try:
+        try:
+            encoder = tiktoken.encoding_for_model(OPENAI_MODEL)
+        except KeyError:
+            encoder = tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"Could not load tiktoken encoding, estimating tokens from length: {e}")
+        return lambda text: len(text) // CHARS_PER_TOKEN
+    
+    return lambda text: len(encoder.encode_ordinary(text))
+
+
+@dataclass(slots=True)
+class TranscriptLine:
+    """A single non-empty transcript line, before chunking."""
+    
+    text: str
+    speaker: str
+    line_index: int
+    source: str
+
+
 class DocumentLoader:
     """Load and chunk transcripts while preserving metadata."""
     
-    def __init__(self, chunk_strategy: str = "speaker_turns"):
+    def __init__(self, chunk_strategy: str = "speaker_turns", max_chunk_tokens: int = MAX_CHUNK_TOKENS):
         """
         Initialize the document loader.
         
         Args:
             chunk_strategy: "speaker_turns" or "time_based"
+            max_chunk_tokens: Token budget for packing speaker turns into one chunk
         """
         self.chunk_strategy = chunk_strategy
+        self.max_chunk_tokens = max_chunk_tokens
     
-    def ingest(self, text: str, source: str, metadata: Optional[Dict] = None) -> List[Document]:
+    @staticmethod
+    def _split_speaker(line: str):
+        """Split a "Speaker: text" line into (speaker, content)."""
+        speaker, sep, content = line.partition(":")
+        if sep:
+            return speaker.strip(), content.strip()
+        return "Unknown", line
+    
+    def ingest(self, text: str, source: str) -> Iterator[TranscriptLine]:
         """
-        Convert raw transcript text into Document objects with metadata.
+        Convert raw transcript text into lightweight TranscriptLine records.
+        
+        Lines are read lazily, so the transcript is never split into an
+        intermediate list of strings. Documents are only created per chunk.
         
         Args:
             text: Raw transcript text
             source: Source identifier (filename, meeting ID, etc.)
-            metadata: Optional additional metadata
-            
-        Returns:
-            List of Document objects with metadata
+        
+        Yields:
+            TranscriptLine records, one per non-empty line
         """
         logger.info(f"Ingesting transcript from {source}")
         
-        lines = text.strip().split("\n")
-        documents = []
+        num_lines = 0
         
-        for i, line in enumerate(lines):
+        for i, line in enumerate(io.StringIO(text)):
+            line = line.rstrip("\n")
+            
             if line.strip():  # Skip empty lines
-                doc_metadata = {
-                    "source": source,
-                    "line_index": i,
-                    "original_text": line,
-                }
-                
                 # Extract speaker if present (format: "Speaker: text")
-                if ":" in line:
-                    parts = line.split(":", 1)
-                    speaker = parts[0].strip()
-                    content = parts[1].strip()
-                    doc_metadata["speaker"] = speaker
-                else:
-                    content = line
-                    doc_metadata["speaker"] = "Unknown"
-                
-                # Add any provided metadata
-                if metadata:
-                    doc_metadata.update(metadata)
+                speaker, content = self._split_speaker(line)
                 
-                doc = Document(page_content=content, metadata=doc_metadata)
-                documents.append(doc)
+                num_lines += 1
+                yield TranscriptLine(text=content, speaker=speaker, line_index=i, source=source)
         
-        logger.info(f"Ingested {len(documents)} lines from transcript")
-        return documents
+        logger.info(f"Ingested {num_lines} lines from transcript")
     
-    def chunk_by_speaker_turns(self, documents: List[Document]) -> List[Document]:
+    def _pack_turns(self, turns: Iterable[Tuple[str, str]], source: str) -> Iterator[Document]:
         """
-        Chunk transcript by speaker turns, preserving context.
+        Pack consecutive (speaker, text) lines into chunks up to the token budget.
         
-        Args:
-            documents: List of Document objects
-            
-        Returns:
-            Chunked documents with turn-based grouping
+        Lines are rendered as "Speaker: text" so speaker context survives
+        packing several turns together. A chunk is flushed when the next line
+        would push it over max_chunk_tokens; a single oversized line becomes
+        its own chunk.
         """
-        logger.info("Chunking transcript by speaker turns")
+        count_tokens = _token_counter()
         
-        if not documents:
-            return []
-        
-        chunks = []
         current_chunk_content = []
-        current_speaker = None
+        current_speakers = []
+        current_tokens = 0
         chunk_index = 0
         
-        for doc in documents:
-            speaker = doc.metadata.get("speaker", "Unknown")
+        for speaker, text in turns:
+            line = text if speaker == "Unknown" else f"{speaker}: {text}"
+            line_tokens = count_tokens(line) + 1  # + newline separator
             
-            # Start new chunk when speaker changes
-            if current_speaker is not None and speaker != current_speaker:
-                # Save current chunk
-                if current_chunk_content:
-                    chunk_text = "\n".join(current_chunk_content)
-                    chunk_metadata = {
+            if current_chunk_content and current_tokens + line_tokens > self.max_chunk_tokens:
+                yield Document(
+                    page_content="\n".join(current_chunk_content),
+                    metadata={
                         "chunk_index": chunk_index,
                         "chunk_strategy": "speaker_turns",
-                        "speaker": current_speaker,
+                        "speaker_list": current_speakers,
                         "num_lines": len(current_chunk_content),
-                        "source": doc.metadata.get("source", "unknown"),
+                        "num_tokens": current_tokens,
+                        "source": source,
                     }
-                    chunks.append(Document(page_content=chunk_text, metadata=chunk_metadata))
-                    chunk_index += 1
-                    current_chunk_content = []
+                )
+                chunk_index += 1
+                current_chunk_content = []
+                current_speakers = []
+                current_tokens = 0
             
-            current_chunk_content.append(doc.page_content)
-            current_speaker = speaker
+            current_chunk_content.append(line)
+            current_tokens += line_tokens
+            if speaker not in current_speakers:
+                current_speakers.append(speaker)
         
         # Don't forget the last chunk
         if current_chunk_content:
-            chunk_text = "\n".join(current_chunk_content)
-            chunk_metadata = {
-                "chunk_index": chunk_index,
-                "chunk_strategy": "speaker_turns",
-                "speaker": current_speaker,
-                "num_lines": len(current_chunk_content),
-                "source": documents[-1].metadata.get("source", "unknown"),
-            }
-            chunks.append(Document(page_content=chunk_text, metadata=chunk_metadata))
+            yield Document(
+                page_content="\n".join(current_chunk_content),
+                metadata={
+                    "chunk_index": chunk_index,
+                    "chunk_strategy": "speaker_turns",
+                    "speaker_list": current_speakers,
+                    "num_lines": len(current_chunk_content),
+                    "num_tokens": current_tokens,
+                    "source": source,
+                }
+            )
+            chunk_index += 1
         
-        logger.info(f"Created {len(chunks)} chunks from speaker turns")
-        return chunks
+        logger.info(f"Created {chunk_index} chunks from speaker turns")
+    
+    def chunk_by_speaker_turns(self, lines: Iterable[TranscriptLine]) -> Iterator[Document]:
+        """
+        Chunk transcript by speaker turns, packing turns up to the token budget.
+        
+        Args:
+            lines: Iterable of TranscriptLine records (consumed in a single pass)
+            
+        Yields:
+            Chunked documents with turn-based grouping
+        """
+        logger.info("Chunking transcript by speaker turns")
+        
+        lines = iter(lines)
+        first = next(lines, None)
+        if first is None:
+            logger.info("Created 0 chunks from speaker turns")
+            return
+        
+        turns = ((line.speaker, line.text) for line in itertools.chain([first], lines))
+        yield from self._pack_turns(turns, first.source)
+    
+    def process_fused(self, text: str, source: str) -> Iterator[Document]:
+        """
+        Ingest and chunk by speaker turns in a single pass.
+        
+        Equivalent to chunk_by_speaker_turns(ingest(...)), but reads lines
+        straight into the current chunk without creating a record per line.
+        
+        Args:
+            text: Raw transcript text
+            source: Source identifier
+        
+        Yields:
+            Chunked documents with turn-based grouping
+        """
+        logger.info(f"Ingesting and chunking transcript from {source} by speaker turns")
+        
+        turns = (
+            self._split_speaker(line.rstrip("\n"))
+            for line in io.StringIO(text)
+            if line.strip()  # Skip empty lines
+        )
+        yield from self._pack_turns(turns, source)
     
-    def chunk_by_time(self, documents: List[Document], chunk_size_minutes: int = CHUNK_SIZE_MINUTES) -> List[Document]:
+    def chunk_by_time(self, lines: Iterable[TranscriptLine], chunk_size_minutes: int = CHUNK_SIZE_MINUTES) -> Iterator[Document]:
         """
         Chunk transcript by time intervals.
         
         Args:
-            documents: List of Document objects
+            lines: Iterable of TranscriptLine records (consumed in a single pass)
             chunk_size_minutes: Size of each chunk in minutes
-            
-        Returns:
+        
+        Yields:
             Chunked documents by time
         """
         logger.info(f"Chunking transcript by {chunk_size_minutes} minute intervals")
         
         # Simple implementation: group documents by rough time estimation
-        # In production, you'd parse timestamp metadata
-        chunks = []
-        chunk_size = max(1, len(documents) // max(1, len(documents) // (chunk_size_minutes * 30)))
-        
-        for i, chunk_docs in enumerate([documents[j:j + chunk_size] for j in range(0, len(documents), chunk_size)]):
-            if chunk_docs:
-                chunk_text = "\n".join([doc.page_content for doc in chunk_docs])
-                chunk_metadata = {
-                    "chunk_index": i,
-                    "chunk_strategy": "time_based",
-                    "num_lines": len(chunk_docs),
-                    "source": chunk_docs[0].metadata.get("source", "unknown"),
-                }
-                chunks.append(Document(page_content=chunk_text, metadata=chunk_metadata))
+        # (~30 lines per minute). In production, you'd parse timestamp metadata
+        chunk_size = max(1, chunk_size_minutes * 30)
+        lines = iter(lines)
+        chunk_index = 0
         
-        logger.info(f"Created {len(chunks)} time-based chunks")
-        return chunks
+        while chunk_lines := list(itertools.islice(lines, chunk_size)):
+            chunk_metadata = {
+                "chunk_index": chunk_index,
+                "chunk_strategy": "time_based",
+                "num_lines": len(chunk_lines),
+                "source": chunk_lines[0].source,
+            }
+            yield Document(page_content="\n".join(line.text for line in chunk_lines), metadata=chunk_metadata)
+            chunk_index += 1
+        
+        logger.info(f"Created {chunk_index} time-based chunks")
     
-    def process(self, text: str, source: str, metadata: Optional[Dict] = None) -> List[Document]:
+    def process(self, text: str, source: str, metadata: Optional[Dict] = None) -> Iterator[Document]:
         """
         Full pipeline: ingest → chunk.
         
+        Speaker-turn chunking runs as a single fused pass over the lines;
+        time-based chunking streams TranscriptLine records into chunk_by_time.
+        
         Args:
             text: Raw transcript text
             source: Source identifier
-            metadata: Optional metadata
-            
+            metadata: Optional metadata added to every chunk (chunk fields take precedence)
+        
         Returns:
-            List of chunked documents
+            Iterator of chunked documents
         """
-        documents = self.ingest(text, source, metadata)
-        
         if self.chunk_strategy == "speaker_turns":
-            chunks = self.chunk_by_speaker_turns(documents)
+            chunks = self.process_fused(text, source)
         elif self.chunk_strategy == "time_based":
-            chunks = self.chunk_by_time(documents)
+            chunks = self.chunk_by_time(self.ingest(text, source))
         else:
             logger.warning(f"Unknown chunk strategy: {self.chunk_strategy}, using speaker_turns")
-            chunks = self.chunk_by_speaker_turns(documents)
+            chunks = self.process_fused(text, source)
+        
+        if metadata:
+            chunks = self._with_metadata(chunks, metadata)
         
         return chunks
+    
+    @staticmethod
+    def _with_metadata(chunks: Iterable[Document], metadata: Dict) -> Iterator[Document]:
+        """Merge caller metadata into each chunk's metadata."""
+        for chunk in chunks:
+            chunk.metadata = {**metadata, **chunk.metadata}
+            yield chunk
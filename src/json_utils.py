@@ -0,0 +1,56 @@
+"""Helpers for pulling JSON payloads out of LLM responses."""
+
+from typing import Optional
+
+
+_CLOSING = {"[": "]", "{": "}"}
+
+
+def find_json_block(text: str, opening: str = "[") -> Optional[str]:
+    """
+    Return the first balanced top-level JSON array or object in text.
+    
+    Scans the text once, tracking bracket depth and ignoring brackets inside
+    JSON strings, so trailing prose or code fences containing brackets do not
+    break extraction.
+    
+    Args:
+        text: Raw LLM response text
+        opening: "[" to find an array, "{" to find an object, or "[{" for
+            whichever comes first
+        
+    Returns:
+        The JSON substring, or None if no balanced block was found
+    """
+    if not opening or any(char not in _CLOSING for char in opening):
+        raise ValueError(f"Unsupported opening bracket: {opening!r}")
+    
+    start = None
+    depth = 0
+    in_string = False
+    escape = False
+    
+    for i, char in enumerate(text):
+        if start is None:
+            if char in opening:
+                start = i
+                depth = 1
+            continue
+        
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "[{":
+            depth += 1
+        elif char in "]}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    
+    return None
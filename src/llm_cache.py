@@ -0,0 +1,284 @@
+"""Persistent prompt → response cache for LLM calls."""
+
+import hashlib
+import json
+import os
+from functools import lru_cache
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional
+import numpy as np
+from src.config import (
+    get_logger,
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_PATH,
+    LLM_CACHE_SEMANTIC,
+    LLM_CACHE_SIMILARITY,
+)
+from src.llm_client import ainvoke_with_retry, invoke_with_retry
+
+
+logger = get_logger(__name__)
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+
+class LLMCache:
+    """
+    Cache LLM responses keyed by model, sampling parameters and prompt.
+    
+    Exact hits are looked up by SHA256 of the prompt. When semantic lookup is
+    enabled, misses fall back to the most similar cached prompt (cosine
+    similarity of OpenAI embeddings) for the same model, above a threshold.
+    Entries are appended to a JSONL file so the cache survives across runs.
+    Callers pass a ``valid`` predicate so responses that fail to parse are
+    never stored (and so never replayed on later runs).
+    """
+    
+    def __init__(
+        self,
+        path: Optional[str] = LLM_CACHE_PATH,
+        semantic: bool = LLM_CACHE_SEMANTIC,
+        similarity_threshold: float = LLM_CACHE_SIMILARITY,
+        enabled: bool = True
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            path: JSONL file to persist entries to (None keeps the cache in memory)
+            semantic: Fall back to embedding-similarity lookup on exact misses
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            enabled: When False, every call goes straight to the LLM
+        """
+        self.path = path
+        self.enabled = enabled
+        self.similarity_threshold = similarity_threshold
+        self.entries: Dict[str, str] = {}
+        
+        # Semantic index: parallel lists of entry keys, models and unit-norm embeddings
+        self._keys: List[str] = []
+        self._models: List[str] = []
+        self._vectors: List[np.ndarray] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._pending: Dict[str, np.ndarray] = {}
+        self._embedder = None
+        
+        if enabled and semantic:
+            from langchain_openai import OpenAIEmbeddings
+            self._embedder = OpenAIEmbeddings(model=EMBEDDING_MODEL)
+        
+        if enabled and path:
+            self._load()
+    
+    @staticmethod
+    def key(model: str, prompt: str) -> str:
+        """Exact-match cache key for a model/prompt pair."""
+        return hashlib.sha256(f"{model}\n{prompt}".encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def model_id(llm, model: str) -> str:
+        """
+        Identify a model together with the call parameters that change its output.
+        
+        Temperature, max_tokens and any bound response_format (e.g. JSON mode)
+        are folded in, so differently configured clients never share entries.
+        """
+        bound_kwargs = getattr(llm, "kwargs", None) or {}
+        base = getattr(llm, "bound", llm)
+        params = {
+            "temperature": getattr(base, "temperature", None),
+            "max_tokens": getattr(base, "max_tokens", None),
+            "response_format": bound_kwargs.get("response_format"),
+        }
+        return f"{model} {json.dumps(params, sort_keys=True)}"
+    
+    def _load(self):
+        """Load persisted entries from the JSONL file."""
+        if not os.path.exists(self.path):
+            return
+        
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    key, response = entry["key"], entry["response"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    logger.warning(f"Skipping corrupt cache line in {self.path}")
+                    continue
+                
+                self.entries[key] = response
+                if entry.get("embedding") is not None and entry.get("model") is not None:
+                    self._index(key, entry["model"], np.asarray(entry["embedding"], dtype=np.float32))
+        
+        logger.info(f"Loaded {len(self.entries)} cached LLM responses from {self.path}")
+    
+    def _index(self, key: str, model: str, vector: np.ndarray):
+        """Add a unit-norm embedding to the semantic index."""
+        self._keys.append(key)
+        self._models.append(model)
+        self._vectors.append(vector)
+        self._matrix = None
+    
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        """Convert an embedding to a unit-norm float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    
+    def _nearest(self, model: str, vector: np.ndarray) -> Optional[str]:
+        """Return the cached response for the most similar prompt, if close enough."""
+        if not self._vectors:
+            return None
+        
+        if self._matrix is None:
+            self._matrix = np.vstack(self._vectors)
+        
+        similarities = self._matrix @ vector
+        similarities[np.asarray(self._models) != model] = -1.0
+        best = int(np.argmax(similarities))
+        
+        if similarities[best] >= self.similarity_threshold:
+            logger.debug(f"Semantic cache hit (similarity {similarities[best]:.3f})")
+            return self.entries.get(self._keys[best])
+        return None
+    
+    def get(self, model: str, prompt: str) -> Optional[str]:
+        """Look up a cached response, or None on a miss."""
+        key = self.key(model, prompt)
+        if key in self.entries:
+            return self.entries[key]
+        
+        if self._embedder is None:
+            return None
+        
+        vector = self._normalize(self._embedder.embed_query(prompt))
+        self._pending[key] = vector
+        return self._nearest(model, vector)
+    
+    async def aget(self, model: str, prompt: str) -> Optional[str]:
+        """Asynchronously look up a cached response, or None on a miss."""
+        key = self.key(model, prompt)
+        if key in self.entries:
+            return self.entries[key]
+        
+        if self._embedder is None:
+            return None
+        
+        vector = self._normalize(await self._embedder.aembed_query(prompt))
+        self._pending[key] = vector
+        return self._nearest(model, vector)
+    
+    def put(self, model: str, prompt: str, response: str):
+        """Store a response and append it to the cache file."""
+        key = self.key(model, prompt)
+        self.entries[key] = response
+        
+        vector = self._pending.pop(key, None)
+        if vector is None and self._embedder is not None:
+            vector = self._normalize(self._embedder.embed_query(prompt))
+        if vector is not None:
+            self._index(key, model, vector)
+        
+        if self.path:
+            entry = {"key": key, "model": model, "response": response}
+            if vector is not None:
+                entry["embedding"] = vector.tolist()
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+    
+    def invoke(self, llm, model: str, prompt: str, valid: Optional[Callable[[str], bool]] = None) -> str:
+        """
+        Return the cached response for a prompt, calling the LLM on a miss.
+        
+        Args:
+            llm: Chat model to call on a miss
+            model: Model name
+            prompt: Full prompt text
+            valid: Optional check that the response parses; failing responses are not cached
+        """
+        if not self.enabled:
+            return invoke_with_retry(llm, prompt).content
+        
+        model = self.model_id(llm, model)
+        cached = self.get(model, prompt)
+        if cached is not None:
+            return cached
+        
+        response = invoke_with_retry(llm, prompt).content
+        self._store(model, prompt, response, valid)
+        return response
+    
+    async def ainvoke(self, llm, model: str, prompt: str, valid: Optional[Callable[[str], bool]] = None) -> str:
+        """Asynchronously return the cached response, calling the LLM on a miss (see invoke)."""
+        if not self.enabled:
+            return (await ainvoke_with_retry(llm, prompt)).content
+        
+        model = self.model_id(llm, model)
+        cached = await self.aget(model, prompt)
+        if cached is not None:
+            return cached
+        
+        response = (await ainvoke_with_retry(llm, prompt)).content
+        self._store(model, prompt, response, valid)
+        return response
+    
+    def stream(self, llm, model: str, prompt: str, valid: Optional[Callable[[str], bool]] = None) -> Iterator[str]:
+        """
+        Stream response text for a prompt, yielding a cached response in one piece.
+        
+        ``valid`` is checked once the stream is exhausted, after the caller has
+        consumed every piece, so it may inspect the caller's own parse state.
+        """
+        if self.enabled:
+            model = self.model_id(llm, model)
+            cached = self.get(model, prompt)
+            if cached is not None:
+                yield cached
+                return
+        
+        pieces = []
+        for chunk in llm.stream(prompt):
+            pieces.append(chunk.content)
+            yield chunk.content
+        
+        if self.enabled:
+            self._store(model, prompt, "".join(pieces), valid)
+    
+    async def astream(
+        self,
+        llm,
+        model: str,
+        prompt: str,
+        valid: Optional[Callable[[str], bool]] = None
+    ) -> AsyncIterator[str]:
+        """Asynchronously stream response text, yielding a cached response in one piece (see stream)."""
+        if self.enabled:
+            model = self.model_id(llm, model)
+            cached = await self.aget(model, prompt)
+            if cached is not None:
+                yield cached
+                return
+        
+        pieces = []
+        async for chunk in llm.astream(prompt):
+            pieces.append(chunk.content)
+            yield chunk.content
+        
+        if self.enabled:
+            self._store(model, prompt, "".join(pieces), valid)
+    
+    def _store(self, model: str, prompt: str, response: str, valid: Optional[Callable[[str], bool]]):
+        """Cache a fresh response unless the caller's check rejects it."""
+        if valid is not None and not valid(response):
+            logger.debug("Not caching LLM response that failed to parse")
+            self._pending.pop(self.key(model, prompt), None)
+            return
+        self.put(model, prompt, response)
+
+
+@lru_cache(maxsize=None)
+def get_llm_cache() -> LLMCache:
+    """Get the process-wide LLM cache shared by all chains."""
+    return LLMCache(enabled=LLM_CACHE_ENABLED)
@@ -0,0 +1,74 @@
+"""Shared ChatOpenAI clients backed by a single HTTP connection pool."""
+
+from functools import lru_cache
+from typing import Optional
+import httpx
+import openai
+from langchain_openai import ChatOpenAI
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+from src.config import get_logger
+
+
+logger = get_logger(__name__)
+
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+# One pool per transport type, shared by every chain so connections (and TLS
+# sessions) are reused. Pooled async connections belong to the event loop that
+# opened them, so the pipeline runs all of its async phases in one loop.
+_http_client = httpx.Client(limits=HTTP_LIMITS)
+_http_async_client = httpx.AsyncClient(limits=HTTP_LIMITS)
+
+# Transient API failures worth retrying; other errors (bad request, auth) fail immediately
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+# Per-call retry with jittered exponential backoff, so one transient failure
+# doesn't abort a whole asyncio.gather batch
+llm_retry = retry(
+    stop=stop_after_attempt(5),
+    wait=wait_random_exponential(min=1, max=30),
+    retry=retry_if_exception_type(RETRYABLE_ERRORS),
+    reraise=True
+)
+
+
+@lru_cache(maxsize=None)
+def get_chat_llm(model_name: str, temperature: float, max_tokens: Optional[int] = None) -> ChatOpenAI:
+    """
+    Get a shared ChatOpenAI instance for the given settings.
+    
+    Args:
+        model_name: OpenAI model name
+        temperature: Sampling temperature
+        max_tokens: Optional completion token limit
+    
+    Returns:
+        ChatOpenAI cached per (model_name, temperature, max_tokens)
+    """
+    logger.debug(f"Creating ChatOpenAI client for {model_name} (temperature={temperature}, max_tokens={max_tokens})")
+    return ChatOpenAI(
+        model=model_name,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        max_retries=0,  # Retries are handled by llm_retry
+        http_client=_http_client,
+        http_async_client=_http_async_client
+    )
+
+
+@llm_retry
+def invoke_with_retry(llm, prompt: str):
+    """Invoke an LLM, retrying transient API errors."""
+    return llm.invoke(prompt)
+
+
+@llm_retry
+async def ainvoke_with_retry(llm, prompt: str):
+    """Asynchronously invoke an LLM, retrying transient API errors."""
+    return await llm.ainvoke(prompt)
@@ -1,5 +1,6 @@
 """Main orchestration - MAP-REDUCE pipeline."""
 
+import asyncio
 from typing import List
 from src.document_loader import DocumentLoader
 from src.map_chain import MapChain
@@ -8,7 +9,7 @@ from src.confidence_chain import ConfidenceChain
 from src.validation import ValidationLayer
 from src.models import ActionItem
 from src.config import get_logger, CONFIDENCE_THRESHOLD
-import json
+import orjson
 
 
 logger = get_logger(__name__)
@@ -38,22 +39,24 @@ class ActionItemExtractor:
         Returns:
             List of validated ActionItem objects
         """
+        # One event loop for every LLM phase, so pooled connections are reused throughout
+        return asyncio.run(self.aextract(transcript_text, source))
+    
+    async def aextract(self, transcript_text: str, source: str) -> List[ActionItem]:
+        """Asynchronous variant of extract."""
         logger.info(f"Starting extraction pipeline for {source}")
         
         # Step 1: Load and chunk
         logger.info("Step 1: Loading and chunking document")
-        chunks = self.document_loader.load(transcript_text, source)
+        chunks = list(self.document_loader.process(transcript_text, source))
         logger.info(f"Created {len(chunks)} chunks")
         
         # Step 2: MAP - Extract candidates
         logger.info("Step 2: MAP phase - Extracting action items from chunks")
-        map_results = []
+        map_results = await self.map_chain.aextract_batch([c.page_content for c in chunks])
         all_items = []
         
-        for i, chunk in enumerate(chunks):
-            logger.info(f"Processing chunk {i + 1}/{len(chunks)}")
-            result = self.map_chain.extract(chunk.page_content, i, len(chunks))
-            map_results.append(result)
+        for result in map_results:
             all_items.extend(result.items)
         
         logger.info(f"MAP phase extracted {len(all_items)} total items")
@@ -64,19 +67,18 @@ class ActionItemExtractor:
         
         # Step 3: REDUCE - Consolidate
         logger.info("Step 3: REDUCE phase - Consolidating items")
-        reduce_result = self.reduce_chain.consolidate(all_items)
+        reduce_result = await self.reduce_chain.aconsolidate(all_items)
         consolidated_items = reduce_result.items
         logger.info(f"REDUCE phase reduced to {len(consolidated_items)} items")
         
         # Step 4: Confidence scoring
         logger.info("Step 4: Confidence scoring")
-        scored_items = self.confidence_chain.score_batch(consolidated_items)
+        scored_items = await self.confidence_chain.ascore_items(consolidated_items)
         logger.info(f"Scored {len(scored_items)} items")
         
         # Step 5: Validation
         logger.info("Step 5: Validation and edge case handling")
-        validated_items, rejected_items = self.validator.validate_batch(scored_items)
-        validated_items = self.validator.handle_edge_cases(validated_items)
+        validated_items, rejected_items = self.validator.process_batch(scored_items)
         
         logger.info(f"Pipeline complete: {len(validated_items)} valid items, {len(rejected_items)} rejected")
         
@@ -99,10 +101,10 @@ class ActionItemExtractor:
         result = {
             "source": source,
             "total_items": len(items),
-            "items": [item.dict() for item in items]
+            "items": [item.model_dump() for item in items]
         }
         
-        json_output = json.dumps(result, indent=2)
+        json_output = orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
         
         if output_file:
             with open(output_file, "w") as f:
@@ -1,33 +1,97 @@
 """MAP phase - Extract action items from each transcript chunk."""
 
-import yaml
-from typing import List, Optional
+import asyncio
+import time
+from typing import AsyncIterator, Iterator, List, Optional
 from langchain.prompts import PromptTemplate
-from langchain_openai import ChatOpenAI
 from langchain.output_parsers import PydanticOutputParser
+from src.llm_cache import get_llm_cache
+from src.llm_client import get_chat_llm, llm_retry
 from src.models import ActionItem, MapPhaseOutput
-from src.config import get_logger, OPENAI_MODEL, TEMPERATURE, MAX_TOKENS
-import json
+from src.config import get_logger, load_prompt, OPENAI_MODEL, TEMPERATURE, MAX_TOKENS, MAX_CONCURRENCY
+import orjson
 
 
 logger = get_logger(__name__)
 
 
+class _ArrayItemScanner:
+    """
+    Incrementally pull JSON objects out of a streamed JSON array.
+    
+    Tracks bracket depth (ignoring brackets inside strings) and emits the raw
+    text of each object whose parent is an array, as soon as it closes.
+    Consumed text is dropped from the buffer as scanning progresses.
+    """
+    
+    def __init__(self):
+        self.buffer = ""
+        self.seen_array = False
+        self._pos = 0
+        self._stack: List[str] = []
+        self._start: Optional[int] = None
+        self._start_depth = 0
+        self._in_string = False
+        self._escape = False
+    
+    @property
+    def complete(self) -> bool:
+        """True once an array has been opened and every bracket since has closed."""
+        return self.seen_array and not self._stack
+    
+    def feed(self, text: str) -> List[str]:
+        """Add streamed text and return any objects completed by it."""
+        self.buffer += text
+        completed = []
+        
+        for i in range(self._pos, len(self.buffer)):
+            char = self.buffer[i]
+            
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"' and self._stack:
+                self._in_string = True
+            elif char == "[":
+                self._stack.append(char)
+                self.seen_array = True
+            elif char == "{":
+                if self._start is None and self._stack and self._stack[-1] == "[":
+                    self._start = i
+                    self._start_depth = len(self._stack)
+                self._stack.append(char)
+            elif char in "]}" and self._stack:
+                self._stack.pop()
+                if self._start is not None and len(self._stack) == self._start_depth:
+                    completed.append(self.buffer[self._start:i + 1])
+                    self._start = None
+        
+        # Keep only the unfinished object (if any) in the buffer
+        keep = self._start if self._start is not None else len(self.buffer)
+        self.buffer = self.buffer[keep:]
+        self._pos = len(self.buffer)
+        if self._start is not None:
+            self._start = 0
+        
+        return completed
+
+
 class MapChain:
     """LangChain-based MAP chain for action item extraction."""
     
-    def __init__(self, model_name: str = OPENAI_MODEL):
+    def __init__(self, model_name: str = OPENAI_MODEL, max_concurrency: int = MAX_CONCURRENCY):
         """Initialize the MAP chain with LLM and prompts."""
         self.model_name = model_name
-        self.llm = ChatOpenAI(
-            model=model_name,
-            temperature=TEMPERATURE,
-            max_tokens=MAX_TOKENS
-        )
+        self.max_concurrency = max_concurrency
+        self.llm = get_chat_llm(model_name, TEMPERATURE, MAX_TOKENS)
+        self.cache = get_llm_cache()
         
-        # Load prompt from YAML
-        with open("src/prompts/map_prompt.yaml", "r") as f:
-            prompt_config = yaml.safe_load(f)
+        # Load prompt from YAML (parsed once per process)
+        prompt_config = load_prompt("map_prompt.yaml")
         
         self.system_prompt = prompt_config["system_prompt"]
         self.user_prompt_template = prompt_config["user_prompt_template"]
@@ -35,6 +99,85 @@ class MapChain:
         
         logger.info(f"Initialized MAP chain with model: {model_name}")
     
+    def _build_prompt(self, chunk_text: str) -> str:
+        """Format the full MAP prompt for a transcript chunk."""
+        user_prompt = self.user_prompt_template.format(transcript_chunk=chunk_text)
+        return f"{self.system_prompt}\n\n{user_prompt}"
+    
+    def _parse_item(self, object_text: str, chunk_index: int) -> Optional[ActionItem]:
+        """Parse one streamed JSON object into an ActionItem, or None if invalid."""
+        try:
+            item = ActionItem.from_llm(orjson.loads(object_text))
+            item.source_chunk = chunk_index
+            return item
+        except Exception as e:
+            logger.warning(f"Failed to parse item: {e}")
+            return None
+    
+    def extract_stream(self, chunk_text: str, chunk_index: int, total_chunks: int) -> Iterator[ActionItem]:
+        """
+        Stream action items from a single transcript chunk as the LLM generates them.
+        
+        Args:
+            chunk_text: The transcript chunk text
+            chunk_index: Index of this chunk
+            total_chunks: Total number of chunks
+            
+        Yields:
+            ActionItem objects, each as soon as its JSON object is complete
+        """
+        full_prompt = self._build_prompt(chunk_text)
+        scanner = _ArrayItemScanner()
+        
+        logger.info(f"Extracting from chunk {chunk_index + 1}/{total_chunks}")
+        
+        for text in self.cache.stream(self.llm, self.model_name, full_prompt, valid=lambda _: scanner.complete):
+            for object_text in scanner.feed(text):
+                item = self._parse_item(object_text, chunk_index)
+                if item is not None:
+                    yield item
+        
+        if not scanner.seen_array:
+            logger.warning(f"No valid JSON in response for chunk {chunk_index}")
+    
+    async def aextract_stream(self, chunk_text: str, chunk_index: int, total_chunks: int) -> AsyncIterator[ActionItem]:
+        """Asynchronous variant of extract_stream."""
+        full_prompt = self._build_prompt(chunk_text)
+        scanner = _ArrayItemScanner()
+        
+        logger.info(f"Extracting from chunk {chunk_index + 1}/{total_chunks}")
+        
+        async for text in self.cache.astream(self.llm, self.model_name, full_prompt, valid=lambda _: scanner.complete):
+            for object_text in scanner.feed(text):
+                item = self._parse_item(object_text, chunk_index)
+                if item is not None:
+                    yield item
+        
+        if not scanner.seen_array:
+            logger.warning(f"No valid JSON in response for chunk {chunk_index}")
+    
+    @llm_retry
+    def _collect_items(self, chunk_text: str, chunk_index: int, total_chunks: int) -> List[ActionItem]:
+        """Consume extract_stream, restarting the stream on transient API errors."""
+        return list(self.extract_stream(chunk_text, chunk_index, total_chunks))
+    
+    @llm_retry
+    async def _acollect_items(self, chunk_text: str, chunk_index: int, total_chunks: int) -> List[ActionItem]:
+        """Consume aextract_stream, restarting the stream on transient API errors."""
+        return [item async for item in self.aextract_stream(chunk_text, chunk_index, total_chunks)]
+    
+    def _error_output(self, error: Exception, chunk_index: int, total_chunks: int, start_time: float) -> MapPhaseOutput:
+        """Build an empty MapPhaseOutput recording an LLM call failure."""
+        logger.error(f"Error in MAP chain: {error}")
+        processing_time = time.time() - start_time
+        return MapPhaseOutput(
+            items=[],
+            chunk_index=chunk_index,
+            total_chunks=total_chunks,
+            processing_time=processing_time,
+            error=str(error)
+        )
+    
     def extract(self, chunk_text: str, chunk_index: int, total_chunks: int) -> MapPhaseOutput:
         """
         Extract action items from a single transcript chunk.
@@ -47,80 +190,65 @@ class MapChain:
         Returns:
             MapPhaseOutput with extracted items
         """
-        import time
         start_time = time.time()
         
         try:
-            # Format the user prompt
-            user_prompt = self.user_prompt_template.format(transcript_chunk=chunk_text)
-            
-            # Create full prompt
-            full_prompt = f"{self.system_prompt}\n\n{user_prompt}"
+            items = self._collect_items(chunk_text, chunk_index, total_chunks)
             
-            logger.info(f"Extracting from chunk {chunk_index + 1}/{total_chunks}")
-            
-            # Call LLM
-            response = self.llm.invoke(full_prompt)
-            response_text = response.content
-            
-            # Parse JSON response
-            try:
-                # Extract JSON from response
-                json_start = response_text.find('[')
-                json_end = response_text.rfind(']') + 1
-                
-                if json_start != -1 and json_end > json_start:
-                    json_str = response_text[json_start:json_end]
-                    items_data = json.loads(json_str)
-                else:
-                    logger.warning(f"No valid JSON in response for chunk {chunk_index}")
-                    items_data = []
-                
-                # Convert to ActionItem objects
-                items = []
-                for item_data in items_data:
-                    try:
-                        item = ActionItem(**item_data)
-                        item.source_chunk = chunk_index
-                        items.append(item)
-                    except Exception as e:
-                        logger.warning(f"Failed to parse item: {e}")
-                
-                processing_time = time.time() - start_time
-                
-                return MapPhaseOutput(
-                    items=items,
-                    chunk_index=chunk_index,
-                    total_chunks=total_chunks,
-                    processing_time=processing_time
-                )
-            
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON decode error: {e}")
-                processing_time = time.time() - start_time
-                return MapPhaseOutput(
-                    items=[],
-                    chunk_index=chunk_index,
-                    total_chunks=total_chunks,
-                    processing_time=processing_time,
-                    error=f"JSON parsing failed: {str(e)}"
-                )
+            return MapPhaseOutput(
+                items=items,
+                chunk_index=chunk_index,
+                total_chunks=total_chunks,
+                processing_time=time.time() - start_time
+            )
         
         except Exception as e:
-            logger.error(f"Error in MAP chain: {e}")
-            processing_time = time.time() - start_time
+            return self._error_output(e, chunk_index, total_chunks, start_time)
+    
+    async def aextract(
+        self,
+        chunk_text: str,
+        chunk_index: int,
+        total_chunks: int,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> MapPhaseOutput:
+        """
+        Asynchronously extract action items from a single transcript chunk.
+        
+        Args:
+            chunk_text: The transcript chunk text
+            chunk_index: Index of this chunk
+            total_chunks: Total number of chunks
+            semaphore: Optional semaphore bounding concurrent LLM requests
+            
+        Returns:
+            MapPhaseOutput with extracted items
+        """
+        start_time = time.time()
+        semaphore = semaphore or asyncio.Semaphore(1)
+        
+        try:
+            async with semaphore:
+                items = await self._acollect_items(chunk_text, chunk_index, total_chunks)
+            
             return MapPhaseOutput(
-                items=[],
+                items=items,
                 chunk_index=chunk_index,
                 total_chunks=total_chunks,
-                processing_time=processing_time,
-                error=str(e)
+                processing_time=time.time() - start_time
             )
+        
+        except Exception as e:
+            return self._error_output(e, chunk_index, total_chunks, start_time)
+    
+    async def aextract_batch(self, chunks: List[str]) -> List[MapPhaseOutput]:
+        """Extract action items from multiple chunks concurrently, preserving chunk order."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        return await asyncio.gather(
+            *[self.aextract(chunk, i, len(chunks), semaphore) for i, chunk in enumerate(chunks)]
+        )
     
     def extract_batch(self, chunks: List[str]) -> List[MapPhaseOutput]:
         """Extract action items from multiple chunks."""
-        results = []
-        for i, chunk in enumerate(chunks):
-            result = self.extract(chunk, i, len(chunks))
-            results.append(result)
-        return results
+        return asyncio.run(self.aextract_batch(chunks))
@@ -1,23 +1,86 @@
 """Pydantic models for action items and responses."""
 
-from pydantic import BaseModel, Field
+import re
+import sys
+from enum import IntEnum
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 from datetime import datetime
 
 
+# Interned owner default, shared so comparisons against it short-circuit on identity
+UNASSIGNED_OWNER = sys.intern("Unassigned")
+
+_VAGUE_DEADLINES = ("soon", "ASAP", "when possible", "this week")
+
+# Matched against lowercased text: re.IGNORECASE makes CPython's re several times slower
+_VAGUE_DEADLINE_RE = re.compile("|".join(re.escape(term.lower()) for term in _VAGUE_DEADLINES))
+
+
+class OwnerKind(IntEnum):
+    """Coarse classification of an item's owner field."""
+    
+    UNASSIGNED = 0
+    NAMED = 1
+    MULTIPLE = 2
+
+
+class DeadlineKind(IntEnum):
+    """Coarse classification of an item's deadline field."""
+    
+    UNSPECIFIED = 0
+    VAGUE = 1
+    SPECIFIC = 2
+
+
+def classify_owner(owner: Optional[str]) -> OwnerKind:
+    """Classify an owner string as unassigned, a single name, or several names."""
+    if not owner or not owner.strip() or owner == UNASSIGNED_OWNER:
+        return OwnerKind.UNASSIGNED
+    # Multiple owners listed without clear assignment
+    if "," not in owner and "and" in owner.lower():
+        return OwnerKind.MULTIPLE
+    return OwnerKind.NAMED
+
+
+def classify_deadline(deadline: Optional[str]) -> DeadlineKind:
+    """Classify a deadline string as unspecified, vague, or specific."""
+    if not deadline or not deadline.strip() or deadline == "Not specified":
+        return DeadlineKind.UNSPECIFIED
+    if _VAGUE_DEADLINE_RE.search(deadline.lower()):
+        return DeadlineKind.VAGUE
+    return DeadlineKind.SPECIFIC
+
+
 class ActionItem(BaseModel):
     """Schema for extracted action item."""
     
     task: str = Field(..., description="The action task to be completed")
-    owner: str = Field(default="Unassigned", description="Person responsible for the task")
+    owner: str = Field(default=UNASSIGNED_OWNER, description="Person responsible for the task")
     deadline: Optional[str] = Field(default=None, description="When the task should be completed")
     confidence: float = Field(default=0.5, ge=0.0, le=1.0, description="Confidence score (0-1)")
     source_chunk: Optional[int] = Field(default=None, description="Original chunk index")
     speaker: Optional[str] = Field(default=None, description="Speaker who mentioned the task")
     notes: Optional[str] = Field(default=None, description="Additional context")
 
-    class Config:
-        json_schema_extra = {
+    @classmethod
+    def from_llm(cls, data: dict) -> "ActionItem":
+        """
+        Build an ActionItem from parsed LLM output.
+        
+        Skips Pydantic validation via model_construct when the data already
+        matches the schema, and falls back to full validation otherwise.
+        """
+        if _is_schema_conformant(data):
+            fields = {name: data[name] for name in cls.model_fields if name in data}
+            if "confidence" in fields:
+                fields["confidence"] = float(fields["confidence"])
+            return cls.model_construct(**fields)
+        
+        return cls(**data)
+
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "task": "Implement user authentication",
                 "owner": "Sarah",
@@ -28,6 +91,33 @@ class ActionItem(BaseModel):
                 "notes": "Mentioned during security discussion"
             }
         }
+    )
+
+
+def _is_schema_conformant(data) -> bool:
+    """Check that raw item data has the types ActionItem expects, without coercion."""
+    if not isinstance(data, dict) or not isinstance(data.get("task"), str):
+        return False
+    
+    if not isinstance(data.get("owner", UNASSIGNED_OWNER), str):
+        return False
+    
+    for field in ("deadline", "speaker", "notes"):
+        value = data.get(field)
+        if value is not None and not isinstance(value, str):
+            return False
+    
+    confidence = data.get("confidence", 0.5)
+    if isinstance(confidence, bool) or not isinstance(confidence, (int, float)):
+        return False
+    if not 0.0 <= confidence <= 1.0:
+        return False
+    
+    source_chunk = data.get("source_chunk")
+    if source_chunk is not None and (isinstance(source_chunk, bool) or not isinstance(source_chunk, int)):
+        return False
+    
+    return True
 
 
 class MapPhaseOutput(BaseModel):
@@ -1,48 +1,171 @@
 """REDUCE phase - Consolidate and deduplicate action items."""
 
-import yaml
-from typing import List
-from langchain_openai import ChatOpenAI
+import asyncio
+import time
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Tuple
+from src.json_utils import find_json_block
+from src.llm_client import ainvoke_with_retry, get_chat_llm
 from src.models import ActionItem, ReducePhaseOutput
-from src.config import get_logger, OPENAI_MODEL, TEMPERATURE, MAX_TOKENS
-import json
+from src.config import (
+    get_logger,
+    load_prompt,
+    OPENAI_MODEL,
+    OPENAI_JSON_MODE,
+    TEMPERATURE,
+    MAX_TOKENS,
+    MAX_CONCURRENCY,
+)
+import orjson
 
 
 logger = get_logger(__name__)
 
+# Tasks at least this similar (difflib ratio) are sent to the LLM together for merging
+SIMILARITY_THRESHOLD = 0.85
+
+# Maximum items per REDUCE prompt; larger inputs are reduced as a tree of groups
+REDUCE_GROUP_SIZE = 30
+
 
 class ReduceChain:
     """LangChain-based REDUCE chain for consolidating action items."""
     
-    def __init__(self, model_name: str = OPENAI_MODEL):
-        """Initialize the REDUCE chain."""
+    def __init__(
+        self,
+        model_name: str = OPENAI_MODEL,
+        max_concurrency: int = MAX_CONCURRENCY,
+        json_mode: bool = OPENAI_JSON_MODE
+    ):
+        """
+        Initialize the REDUCE chain.
+        
+        Args:
+            model_name: OpenAI model to consolidate with
+            max_concurrency: Maximum concurrent REDUCE requests
+            json_mode: Request response_format=json_object (model must support JSON mode)
+        """
         self.model_name = model_name
-        self.llm = ChatOpenAI(
-            model=model_name,
-            temperature=TEMPERATURE - 0.1,  # Lower temperature for consistency
-            max_tokens=MAX_TOKENS
+        self.max_concurrency = max_concurrency
+        self.json_mode = json_mode
+        self.llm = get_chat_llm(
+            model_name,
+            TEMPERATURE - 0.1,  # Lower temperature for consistency
+            MAX_TOKENS
         )
         
-        # Load prompt from YAML
-        with open("src/prompts/reduce_prompt.yaml", "r") as f:
-            prompt_config = yaml.safe_load(f)
+        if json_mode:
+            # The response is then guaranteed to be a JSON object
+            self.llm = self.llm.bind(response_format={"type": "json_object"})
+        
+        # Load prompt from YAML (parsed once per process)
+        prompt_config = load_prompt("reduce_prompt.yaml")
         
         self.system_prompt = prompt_config["system_prompt"]
         self.user_prompt_template = prompt_config["user_prompt_template"]
         
+        # JSON mode can only return an object, so ask for the {"items": [...]} wrapper
+        self.output_instruction = (
+            f"Instead of a bare array, return a JSON object of this shape:\n{prompt_config['output_format']}"
+            if json_mode else None
+        )
+        
         logger.info(f"Initialized REDUCE chain with model: {model_name}")
     
+    @staticmethod
+    def _dedup_key(item: ActionItem) -> Tuple[str, str]:
+        """Normalized (task, owner) key identifying exact duplicates."""
+        return item.task.lower().strip(), item.owner.lower().strip()
+    
+    @staticmethod
+    def _merge_exact(group: List[ActionItem]) -> ActionItem:
+        """Collapse exact duplicates into the highest-confidence item, merging notes."""
+        merged = max(group, key=lambda item: item.confidence).model_copy()
+        
+        if merged.deadline is None:
+            merged.deadline = next((item.deadline for item in group if item.deadline), None)
+        
+        notes = []
+        for item in group:
+            if item.notes and item.notes not in notes:
+                notes.append(item.notes)
+        merged.notes = "; ".join(notes) if notes else None
+        
+        return merged
+    
+    def _collapse_exact_duplicates(self, items: List[ActionItem]) -> List[ActionItem]:
+        """Group items by normalized (task, owner) and merge each group."""
+        groups: Dict[Tuple[str, str], List[ActionItem]] = {}
+        for item in items:
+            groups.setdefault(self._dedup_key(item), []).append(item)
+        
+        return [group[0] if len(group) == 1 else self._merge_exact(group) for group in groups.values()]
+    
+    @staticmethod
+    def _cluster_similar(items: List[ActionItem]) -> List[List[ActionItem]]:
+        """Greedily cluster items whose task text is near-identical."""
+        clusters: List[List[ActionItem]] = []
+        matchers: List[SequenceMatcher] = []
+        
+        for item in items:
+            task = item.task.lower().strip()
+            
+            for cluster, matcher in zip(clusters, matchers):
+                matcher.set_seq1(task)
+                # quick_ratio() is a cheap upper bound on ratio()
+                if matcher.quick_ratio() > SIMILARITY_THRESHOLD and matcher.ratio() > SIMILARITY_THRESHOLD:
+                    cluster.append(item)
+                    break
+            else:
+                # SequenceMatcher caches analysis of seq2, so keep the cluster's task there
+                clusters.append([item])
+                matchers.append(SequenceMatcher(None, "", task, autojunk=False))
+        
+        return clusters
+    
+    @staticmethod
+    def _pack_clusters(clusters: List[List[ActionItem]]) -> List[List[ActionItem]]:
+        """
+        Pack clusters into groups of at most REDUCE_GROUP_SIZE items.
+        
+        Clusters are kept whole where they fit; a cluster larger than a group
+        is split into REDUCE_GROUP_SIZE slices, which the final pass re-merges.
+        """
+        groups: List[List[ActionItem]] = []
+        current: List[ActionItem] = []
+        
+        for cluster in clusters:
+            for start in range(0, len(cluster), REDUCE_GROUP_SIZE):
+                part = cluster[start:start + REDUCE_GROUP_SIZE]
+                if current and len(current) + len(part) > REDUCE_GROUP_SIZE:
+                    groups.append(current)
+                    current = []
+                current.extend(part)
+        
+        if current:
+            groups.append(current)
+        return groups
+    
     def consolidate(self, items: List[ActionItem]) -> ReducePhaseOutput:
+        """Consolidate and deduplicate action items (see aconsolidate)."""
+        return asyncio.run(self.aconsolidate(items))
+    
+    async def aconsolidate(self, items: List[ActionItem]) -> ReducePhaseOutput:
         """
         Consolidate and deduplicate action items.
         
+        Exact duplicates are merged locally and near-duplicates are clustered by
+        task similarity; only clusters with more than one member are sent to the LLM.
+        Those clusters are packed into groups of at most REDUCE_GROUP_SIZE items,
+        reduced concurrently, and the reduced groups are merged in a final pass
+        when their union fits in a single group.
+        
         Args:
             items: List of ActionItem objects to consolidate
             
         Returns:
             ReducePhaseOutput with consolidated items
         """
-        import time
         start_time = time.time()
         
         if not items:
@@ -54,53 +177,143 @@ class ReduceChain:
                 total_processing_time=0
             )
         
+        unique_items = self._collapse_exact_duplicates(items)
+        exact_removed = len(items) - len(unique_items)
+        
+        clusters = self._cluster_similar(unique_items)
+        singletons = [cluster[0] for cluster in clusters if len(cluster) == 1]
+        ambiguous = [item for cluster in clusters if len(cluster) > 1 for item in cluster]
+        
+        logger.info(
+            f"Local dedup removed {exact_removed} exact duplicates; "
+            f"{len(ambiguous)} items in {len(clusters) - len(singletons)} clusters need merging"
+        )
+        
+        if not ambiguous:
+            return ReducePhaseOutput(
+                items=singletons,
+                duplicates_removed=exact_removed,
+                fields_filled=0,
+                total_processing_time=time.time() - start_time,
+                notes=f"Consolidated from {len(items)} items without LLM"
+            )
+        
+        groups = self._pack_clusters([cluster for cluster in clusters if len(cluster) > 1])
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        results = await asyncio.gather(
+            *[self._consolidate_with_llm(group, start_time, semaphore) for group in groups]
+        )
+        
+        if len(results) > 1:
+            reduced = [item for result in results for item in result.items]
+            if len(reduced) <= REDUCE_GROUP_SIZE:
+                results.append(await self._consolidate_with_llm(reduced, start_time, semaphore))
+            else:
+                results.append(ReducePhaseOutput(
+                    items=reduced,
+                    duplicates_removed=0,
+                    fields_filled=0,
+                    total_processing_time=0
+                ))
+        
+        final = results[-1]
+        
+        return ReducePhaseOutput(
+            items=final.items + singletons,
+            duplicates_removed=exact_removed + sum(result.duplicates_removed for result in results),
+            fields_filled=sum(result.fields_filled for result in results),
+            total_processing_time=time.time() - start_time,
+            notes=f"Consolidated from {len(items)} items in {len(groups)} LLM groups"
+        )
+    
+    def _parse_response(self, response_text: str) -> Tuple[Optional[list], dict]:
+        """
+        Pull the consolidated item list and summary out of a REDUCE response.
+        
+        Accepts either a bare JSON array of items (what the prompt asks for)
+        or an object with "items" and optional "summary" keys, optionally
+        wrapped in prose.
+        
+        Returns:
+            Tuple of (item dicts or None if no item list was found, summary dict)
+        """
+        json_str = response_text if self.json_mode else find_json_block(response_text, "[{")
+        
+        if json_str is None:
+            logger.warning("No valid JSON in REDUCE response")
+            return None, {}
+        
+        result_data = orjson.loads(json_str)
+        
+        if isinstance(result_data, list):
+            return result_data, {}
+        
+        if isinstance(result_data, dict) and isinstance(result_data.get("items"), list):
+            summary = result_data.get("summary")
+            return result_data["items"], summary if isinstance(summary, dict) else {}
+        
+        logger.warning("REDUCE response JSON has no item list")
+        return None, {}
+    
+    async def _consolidate_with_llm(
+        self,
+        items: List[ActionItem],
+        start_time: float,
+        semaphore: asyncio.Semaphore
+    ) -> ReducePhaseOutput:
+        """Ask the LLM to merge and normalize a list of possibly-duplicate items."""
         try:
-            # Convert items to JSON for LLM
-            items_json = json.dumps([item.dict() for item in items], indent=2)
+            # Convert items to compact JSON for LLM (serialized by pydantic-core, no intermediate dicts)
+            items_json = "[" + ",".join(item.model_dump_json() for item in items) + "]"
             
             # Format the prompt
             user_prompt = self.user_prompt_template.format(items_json=items_json)
             full_prompt = f"{self.system_prompt}\n\n{user_prompt}"
+            if self.output_instruction:
+                full_prompt = f"{full_prompt}\n{self.output_instruction}"
             
             logger.info(f"Consolidating {len(items)} items")
             
             # Call LLM
-            response = self.llm.invoke(full_prompt)
+            async with semaphore:
+                response = await ainvoke_with_retry(self.llm, full_prompt)
             response_text = response.content
             
             # Parse response
             try:
-                json_start = response_text.find('{')
-                json_end = response_text.rfind('}') + 1
-                
-                if json_start != -1 and json_end > json_start:
-                    json_str = response_text[json_start:json_end]
-                    result_data = json.loads(json_str)
-                else:
-                    logger.warning("No valid JSON in REDUCE response")
-                    result_data = {"items": []}
+                item_list, summary = self._parse_response(response_text)
                 
                 # Convert to ActionItem objects
                 consolidated_items = []
-                for item_data in result_data.get("items", []):
+                for item_data in item_list or []:
                     try:
-                        item = ActionItem(**item_data)
+                        item = ActionItem.from_llm(item_data)
                         consolidated_items.append(item)
                     except Exception as e:
                         logger.warning(f"Failed to parse consolidated item: {e}")
                 
-                summary = result_data.get("summary", {})
                 processing_time = time.time() - start_time
                 
+                if not consolidated_items:
+                    logger.warning("No usable items in REDUCE response, keeping originals")
+                    return ReducePhaseOutput(
+                        items=items,  # Return originals if consolidation yields nothing
+                        duplicates_removed=0,
+                        fields_filled=0,
+                        total_processing_time=processing_time,
+                        notes="Consolidation returned no items"
+                    )
+                
                 return ReducePhaseOutput(
                     items=consolidated_items,
-                    duplicates_removed=summary.get("duplicates_removed", 0),
+                    duplicates_removed=summary.get("duplicates_removed", max(len(items) - len(consolidated_items), 0)),
                     fields_filled=summary.get("items_needing_review", 0),
                     total_processing_time=processing_time,
                     notes=f"Consolidated from {len(items)} items"
                 )
             
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error(f"JSON decode error in REDUCE: {e}")
                 processing_time = time.time() - start_time
                 return ReducePhaseOutput(
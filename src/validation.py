@@ -1,21 +1,50 @@
 """Validation and edge case handling."""
 
-from typing import List, Tuple
-from src.models import ActionItem
+import re
+from collections import Counter
+from typing import Callable, List, Optional, Tuple
+from src.models import (
+    ActionItem,
+    DeadlineKind,
+    OwnerKind,
+    classify_deadline,
+    classify_owner,
+    UNASSIGNED_OWNER,
+)
 from src.config import get_logger, CONFIDENCE_THRESHOLD
 
 
 logger = get_logger(__name__)
 
+_VAGUE_TERMS = ("something", "stuff", "thing", "whatever", "etc")
+
+# Precompiled alternation: every term is matched in a single pass over the text.
+# Searched against lowercased text: re.IGNORECASE makes CPython's re several times slower
+_VAGUE_RE = re.compile("|".join(re.escape(term.lower()) for term in _VAGUE_TERMS))
+
+# Constant rejection reasons; details are only formatted when surfaced
+_REASON_LOW_CONFIDENCE = "Confidence too low"
+_REASON_EMPTY = "Task is empty"
+_REASON_VAGUE = "Task description is too vague"
+
+# Appended to notes when a deadline is too vague to act on
+_DEADLINE_MARKER = " [DEADLINE NEEDS CLARIFICATION]"
+
 
 class ValidationLayer:
     """Validate and filter action items."""
     
     def __init__(self, confidence_threshold: float = CONFIDENCE_THRESHOLD):
         """Initialize validation layer."""
-        self.confidence_threshold = confidence_threshold
+        self._confidence_threshold = confidence_threshold
+        self._rejection_reason = self._make_validator(confidence_threshold)
         logger.info(f"Initialized validation with threshold: {confidence_threshold}")
     
+    @property
+    def confidence_threshold(self) -> float:
+        """Minimum confidence for a valid item (fixed at construction; it is baked into the validator)."""
+        return self._confidence_threshold
+    
     def validate_item(self, item: ActionItem) -> Tuple[bool, str]:
         """
         Validate a single action item.
@@ -26,25 +55,56 @@ class ValidationLayer:
         Returns:
             Tuple of (is_valid, reason)
         """
-        # Check confidence threshold
-        if item.confidence < self.confidence_threshold:
-            return False, f"Confidence too low ({item.confidence} < {self.confidence_threshold})"
+        reason = self._rejection_reason(item)
         
-        # Check for empty task
-        if not item.task or not item.task.strip():
-            return False, "Task is empty"
+        if reason is _REASON_LOW_CONFIDENCE:
+            return False, f"{reason} ({item.confidence} < {self.confidence_threshold})"
+        if reason is not None:
+            return False, reason
         
-        # Check for vague task descriptions
-        vague_terms = ["something", "stuff", "thing", "whatever", "etc"]
-        task_lower = item.task.lower()
-        if any(term in task_lower for term in vague_terms):
-            return False, "Task description is too vague"
+        self._check_owner(item)
+        return True, "Valid"
+    
+    @staticmethod
+    def _make_validator(threshold: float) -> Callable[[ActionItem], Optional[str]]:
+        """
+        Build the per-item check with the confidence threshold baked in.
         
-        # Check for unassigned high-priority items
-        if item.owner == "Unassigned" and item.deadline:
-            logger.warning(f"Item without owner has deadline: {item.task}")
+        The returned function reads the threshold from its closure instead of
+        the instance on every call. It returns the constant reason an item
+        fails validation, or None if it passes.
+        """
+        def rejection_reason(item: ActionItem) -> Optional[str]:
+            # Check confidence threshold
+            if item.confidence < threshold:
+                return _REASON_LOW_CONFIDENCE
+            
+            # Check for empty task
+            task = item.task
+            if not task or not task.strip():
+                return _REASON_EMPTY
+            
+            # Check for vague task descriptions
+            if _VAGUE_RE.search(task.lower()):
+                return _REASON_VAGUE
+            
+            return None
         
-        return True, "Valid"
+        return rejection_reason
+    
+    @staticmethod
+    def _check_owner(item: ActionItem):
+        """Warn about unassigned high-priority items."""
+        # Plain field tests (same rules as classify_owner/classify_deadline) keep this per-item check cheap
+        owner = item.owner
+        deadline = item.deadline
+        if (
+            deadline
+            and (owner == UNASSIGNED_OWNER or not owner.strip())
+            and deadline != "Not specified"
+            and deadline.strip()
+        ):
+            logger.warning("Item without owner has deadline: {}", item.task)
     
     def validate_batch(self, items: List[ActionItem]) -> Tuple[List[ActionItem], List[ActionItem]]:
         """
@@ -53,59 +113,106 @@ class ValidationLayer:
         Args:
             items: List of ActionItem objects
             
+        Returns:
+            Tuple of (valid_items, invalid_items)
+        """
+        return self._split_batch(items)
+    
+    def process_batch(self, items: List[ActionItem]) -> Tuple[List[ActionItem], List[ActionItem]]:
+        """
+        Validate items, fill defaults and apply edge cases in a single pass.
+        
+        Equivalent to validate_batch followed by handle_edge_cases on the
+        valid items, but each item is fully processed before moving on.
+        
+        Args:
+            items: List of ActionItem objects
+            
+        Returns:
+            Tuple of (processed valid_items, invalid_items)
+        """
+        return self._split_batch(items, on_valid=self._finish_item)
+    
+    def _split_batch(
+        self,
+        items: List[ActionItem],
+        on_valid: Optional[Callable[[ActionItem], ActionItem]] = None
+    ) -> Tuple[List[ActionItem], List[ActionItem]]:
+        """
+        Split items into valid and invalid lists in one pass.
+        
+        Args:
+            items: List of ActionItem objects
+            on_valid: Optional hook applied to each valid item as it is accepted
+            
         Returns:
             Tuple of (valid_items, invalid_items)
         """
         valid_items = []
         invalid_items = []
+        rejections = Counter()
         
         for item in items:
-            is_valid, reason = self.validate_item(item)
+            reason = self._rejection_reason(item)
             
-            if is_valid:
+            if reason is None:
+                self._check_owner(item)
+                if on_valid is not None:
+                    on_valid(item)
                 valid_items.append(item)
             else:
-                logger.debug(f"Item rejected: {item.task} - {reason}")
+                rejections[reason] += 1
+                logger.trace("Item rejected: {} - {} (confidence {})", item.task, reason, item.confidence)
                 invalid_items.append(item)
         
-        logger.info(f"Validation: {len(valid_items)} valid, {len(invalid_items)} invalid")
+        self._log_summary(valid_items, invalid_items, rejections)
         return valid_items, invalid_items
     
+    @staticmethod
+    def _log_summary(valid_items: List[ActionItem], invalid_items: List[ActionItem], rejections: Counter):
+        """Log one summary line for a validated batch instead of one line per rejection."""
+        logger.info("Validation: {} valid, {} invalid", len(valid_items), len(invalid_items))
+        if rejections:
+            logger.debug("Rejected by reason: {}", rejections.most_common())
+    
     def handle_missing_fields(self, item: ActionItem) -> ActionItem:
         """Fill in missing fields with defaults."""
-        if not item.owner or item.owner.strip() == "":
-            item.owner = "Unassigned"
+        owner = item.owner
+        if not owner or not owner.strip():
+            item.owner = UNASSIGNED_OWNER
         
-        if not item.deadline or item.deadline.strip() == "":
+        deadline = item.deadline
+        if not deadline or not deadline.strip():
             item.deadline = "Not specified"
         
-        if not item.notes:
+        if item.notes == "":
             item.notes = None
         
         return item
     
     def handle_edge_cases(self, items: List[ActionItem]) -> List[ActionItem]:
         """Handle special edge cases."""
-        processed_items = []
+        return [self._finish_item(item) for item in items]
+    
+    def _finish_item(self, item: ActionItem) -> ActionItem:
+        """Fill missing fields, then apply edge-case handling to one item."""
+        return self._apply_edge_cases(self.handle_missing_fields(item))
+    
+    @staticmethod
+    def _apply_edge_cases(item: ActionItem) -> ActionItem:
+        """Flag conflicting owners and vague deadlines on an item with defaults filled."""
+        # Handle conflicting owners; the substring test keeps the classifier off the common path
+        owner = item.owner
+        if "and" in owner.lower() and classify_owner(owner) is OwnerKind.MULTIPLE:
+            # Multiple owners listed without clear assignment
+            logger.warning("Item has multiple owners: {}", owner)
+            # Keep as-is and let human review
         
-        for item in items:
-            # Fill missing fields
-            item = self.handle_missing_fields(item)
-            
-            # Handle conflicting owners
-            if "and" in item.owner.lower() and item.owner.count(",") == 0:
-                # Multiple owners listed without clear assignment
-                logger.warning(f"Item has multiple owners: {item.owner}")
-                # Keep as-is and let human review
-            
-            # Handle vague deadlines
-            if item.deadline:
-                vague_deadlines = ["soon", "ASAP", "when possible", "this week"]
-                if any(term in item.deadline for term in vague_deadlines):
-                    if not item.notes:
-                        item.notes = ""
-                    item.notes += " [DEADLINE NEEDS CLARIFICATION]"
-            
-            processed_items.append(item)
+        # Handle vague deadlines
+        deadline = item.deadline
+        if deadline != "Not specified" and classify_deadline(deadline) is DeadlineKind.VAGUE:
+            notes = item.notes or ""
+            if _DEADLINE_MARKER not in notes:
+                item.notes = notes + _DEADLINE_MARKER
         
-        return processed_items
+        return item
@@ -0,0 +1,96 @@
+"""Tests for confidence scoring."""
+
+import asyncio
+import pytest
+from src.confidence_chain import HEURISTIC_CONFIDENCE, ConfidenceChain
+from src.models import ActionItem
+
+
+@pytest.fixture
+def chain(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    return ConfidenceChain()
+
+
+def make_items(count):
+    return [ActionItem(task=f"Task number {i}", confidence=0.5) for i in range(count)]
+
+
+def fake_llm(chain, monkeypatch, group_response, single_response="0.3"):
+    """Replace the cached LLM call with canned grouped and single-item responses."""
+    prompts = []
+    
+    async def fake_ainvoke(llm, model, prompt, valid=None):
+        prompts.append(prompt)
+        if "JSON array" not in prompt:
+            return single_response
+        if isinstance(group_response, Exception):
+            raise group_response
+        return group_response
+    
+    monkeypatch.setattr(chain.cache, "ainvoke", fake_ainvoke)
+    return prompts
+
+
+def grouped(prompts):
+    return [p for p in prompts if "JSON array" in p]
+
+
+class TestGroupedScoring:
+    """Tests for ConfidenceChain.ascore_all."""
+    
+    def test_scores_applied_in_order(self, chain, monkeypatch):
+        prompts = fake_llm(chain, monkeypatch, "[0.1, 0.7, 2.0]")
+        items = asyncio.run(chain.ascore_all(make_items(3)))
+        
+        assert [item.confidence for item in items] == [0.1, 0.7, 1.0]
+        assert len(prompts) == 1
+    
+    @pytest.mark.parametrize("response", ["[0.1, 0.7]", "[0.1, 0.7, 0.2, 0.9]", "no scores", "[0.1, 0.7"])
+    def test_wrong_length_falls_back_to_individual(self, chain, monkeypatch, response):
+        prompts = fake_llm(chain, monkeypatch, response)
+        items = asyncio.run(chain.ascore_all(make_items(3)))
+        
+        assert [item.confidence for item in items] == [0.3, 0.3, 0.3]
+        assert len(prompts) == 4
+    
+    def test_non_numeric_element_rescored_alone(self, chain, monkeypatch):
+        prompts = fake_llm(chain, monkeypatch, '[0.1, "high", null]')
+        items = asyncio.run(chain.ascore_all(make_items(3)))
+        
+        assert [item.confidence for item in items] == [0.1, 0.3, 0.3]
+        assert len(prompts) == 3
+    
+    def test_failed_group_falls_back_to_individual(self, chain, monkeypatch):
+        prompts = fake_llm(chain, monkeypatch, RuntimeError("boom"))
+        items = asyncio.run(chain.ascore_all(make_items(2)))
+        
+        assert [item.confidence for item in items] == [0.3, 0.3]
+        assert len(prompts) == 3
+    
+    def test_unparseable_single_score_keeps_confidence(self, chain, monkeypatch):
+        fake_llm(chain, monkeypatch, "[]", single_response="very likely")
+        items = asyncio.run(chain.ascore_all(make_items(2)))
+        
+        assert [item.confidence for item in items] == [0.5, 0.5]
+
+
+class TestHeuristicScoring:
+    """Tests for ConfidenceChain.ascore_items."""
+    
+    def test_clear_cut_items_skip_llm(self, chain, monkeypatch):
+        clear = ActionItem(task="Send the budget draft to finance", owner="Sam", deadline="Friday")
+        vague = [
+            ActionItem(task="Send the budget draft to finance", deadline="Friday"),
+            ActionItem(task="Send the budget draft to finance", owner="Sam"),
+            ActionItem(task="Send budget", owner="Sam", deadline="Friday"),
+        ]
+        prompts = fake_llm(chain, monkeypatch, "[0.2, 0.2, 0.2]")
+        
+        asyncio.run(chain.ascore_items([clear] + vague))
+        
+        assert clear.confidence == HEURISTIC_CONFIDENCE
+        assert [item.confidence for item in vague] == [0.2, 0.2, 0.2]
+        assert len(grouped(prompts)) == 1
+        assert "Send budget" in prompts[0]
+        assert prompts[0].count("Send the budget draft to finance") == 2
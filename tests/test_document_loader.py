@@ -0,0 +1,61 @@
+"""Tests for transcript chunking."""
+
+import pytest
+import src.document_loader as document_loader
+from src.document_loader import CHARS_PER_TOKEN, DocumentLoader
+
+
+TRANSCRIPT = "Sam: Let's ship the beta on Friday\nAl: I'll update the release notes\nSam: Great, thanks"
+
+
+class _WordEncoder:
+    """Stand-in tiktoken encoding that counts one token per word."""
+    
+    def encode_ordinary(self, text):
+        return text.split()
+
+
+@pytest.fixture(autouse=True)
+def fresh_token_counter():
+    document_loader._token_counter.cache_clear()
+    yield
+    document_loader._token_counter.cache_clear()
+
+
+def offline(*args, **kwargs):
+    raise ConnectionError("openaipublic.blob.core.windows.net unreachable")
+
+
+class TestTokenCounting:
+    """Tests for token-budgeted chunking."""
+    
+    def test_uses_tiktoken_encoding(self, monkeypatch):
+        monkeypatch.setattr(document_loader.tiktoken, "encoding_for_model", lambda model: _WordEncoder())
+        
+        count_tokens = document_loader._token_counter()
+        
+        assert count_tokens("one two three") == 3
+    
+    def test_unknown_model_uses_default_encoding(self, monkeypatch):
+        def unknown_model(model):
+            raise KeyError(model)
+        
+        monkeypatch.setattr(document_loader.tiktoken, "encoding_for_model", unknown_model)
+        monkeypatch.setattr(document_loader.tiktoken, "get_encoding", lambda name: _WordEncoder())
+        
+        assert document_loader._token_counter()("one two") == 2
+    
+    def test_offline_falls_back_to_length_estimate(self, monkeypatch):
+        monkeypatch.setattr(document_loader.tiktoken, "encoding_for_model", offline)
+        monkeypatch.setattr(document_loader.tiktoken, "get_encoding", offline)
+        
+        assert document_loader._token_counter()("x" * 40) == 40 // CHARS_PER_TOKEN
+    
+    def test_process_works_offline(self, monkeypatch):
+        monkeypatch.setattr(document_loader.tiktoken, "encoding_for_model", offline)
+        monkeypatch.setattr(document_loader.tiktoken, "get_encoding", offline)
+        
+        chunks = list(DocumentLoader(max_chunk_tokens=12).process(TRANSCRIPT, "meeting.txt"))
+        
+        assert [chunk.page_content for chunk in chunks] == TRANSCRIPT.split("\n")
+        assert all(chunk.metadata["num_tokens"] <= 12 for chunk in chunks)
@@ -0,0 +1,146 @@
+"""Tests for parsing JSON payloads out of LLM responses."""
+
+import orjson
+import pytest
+from src.json_utils import find_json_block
+from src.map_chain import _ArrayItemScanner
+from src.models import ActionItem
+
+
+def scan(pieces):
+    """Feed text pieces to a fresh scanner and collect every completed object."""
+    scanner = _ArrayItemScanner()
+    objects = []
+    for piece in pieces:
+        objects.extend(scanner.feed(piece))
+    return scanner, [orjson.loads(text) for text in objects]
+
+
+class TestFindJsonBlock:
+    """Tests for find_json_block."""
+    
+    def test_array(self):
+        assert find_json_block('[{"task": "a"}]') == '[{"task": "a"}]'
+    
+    def test_object(self):
+        assert find_json_block('{"items": []}', "{") == '{"items": []}'
+    
+    def test_brackets_inside_strings(self):
+        text = '[{"task": "fix ] and [ in parser", "notes": "use {braces}"}]'
+        assert find_json_block(text) == text
+    
+    def test_escaped_quote_inside_string(self):
+        text = r'[{"task": "say \"]\" twice"}]'
+        assert find_json_block(text) == text
+    
+    def test_prose_before_and_after(self):
+        text = 'Here are the items:\n```json\n[{"task": "a"}]\n```\nLet me know [if] anything else.'
+        assert find_json_block(text) == '[{"task": "a"}]'
+    
+    def test_either_opening_takes_first(self):
+        assert find_json_block('Result: [{"task": "a"}] {"x": 1}', "[{") == '[{"task": "a"}]'
+        assert find_json_block('Result: {"items": [{"task": "a"}]}', "[{") == '{"items": [{"task": "a"}]}'
+    
+    def test_unbalanced_returns_none(self):
+        assert find_json_block('[{"task": "a"}') is None
+    
+    def test_no_block_returns_none(self):
+        assert find_json_block("No action items found.") is None
+    
+    def test_rejects_unknown_opening(self):
+        with pytest.raises(ValueError):
+            find_json_block("<a>", "<")
+
+
+class TestArrayItemScanner:
+    """Tests for the streaming MAP output scanner."""
+    
+    def test_whole_array(self):
+        scanner, objects = scan(['[{"task": "a"}, {"task": "b"}]'])
+        assert scanner.seen_array
+        assert objects == [{"task": "a"}, {"task": "b"}]
+    
+    def test_brackets_inside_strings(self):
+        _, objects = scan(['[{"task": "fix ] and [", "notes": "{not an object}"}]'])
+        assert objects == [{"task": "fix ] and [", "notes": "{not an object}"}]
+    
+    def test_items_wrapper(self):
+        _, objects = scan(['{"items": [{"task": "a"}, {"task": "b"}]}'])
+        assert objects == [{"task": "a"}, {"task": "b"}]
+    
+    def test_nested_object_emitted_whole(self):
+        _, objects = scan(['[{"task": "a", "meta": {"x": [1, {"y": 2}]}}]'])
+        assert objects == [{"task": "a", "meta": {"x": [1, {"y": 2}]}}]
+    
+    @pytest.mark.parametrize("size", [1, 2, 3, 7])
+    def test_chunk_boundaries_split_objects(self, size):
+        text = '[{"task": "ship \\"v2\\" [beta]", "owner": "Sam"}, {"task": "b"}]'
+        pieces = [text[i:i + size] for i in range(0, len(text), size)]
+        _, objects = scan(pieces)
+        assert objects == [{"task": 'ship "v2" [beta]', "owner": "Sam"}, {"task": "b"}]
+    
+    def test_object_emitted_as_soon_as_it_closes(self):
+        scanner = _ArrayItemScanner()
+        assert scanner.feed('[{"task": "a"') == []
+        assert scanner.feed('}, {"task"') == ['{"task": "a"}']
+        assert scanner.feed(': "b"}]') == ['{"task": "b"}']
+    
+    def test_prose_before_and_after(self):
+        _, objects = scan(['Sure! Here you go:\n```json\n', '[{"task": "a"}]', '\n```\nHope "this" helps.'])
+        assert objects == [{"task": "a"}]
+    
+    def test_no_array(self):
+        scanner, objects = scan(["I could not find any action items."])
+        assert not scanner.seen_array
+        assert objects == []
+    
+    def test_complete_only_once_array_closes(self):
+        scanner, _ = scan(['[{"task": "a"}, {"task": "b"'])
+        assert scanner.seen_array and not scanner.complete
+        scanner.feed("}]")
+        assert scanner.complete
+
+
+class TestActionItemFromLlm:
+    """Tests for ActionItem.from_llm."""
+    
+    def test_conformant_data_skips_validation(self):
+        item = ActionItem.from_llm({"task": "a", "owner": "Sam", "confidence": 1, "extra": "ignored"})
+        assert item.task == "a"
+        assert item.owner == "Sam"
+        assert item.confidence == 1.0
+        assert isinstance(item.confidence, float)
+        assert item.deadline is None
+    
+    def test_defaults_applied(self):
+        item = ActionItem.from_llm({"task": "a"})
+        assert item.owner == "Unassigned"
+        assert item.confidence == 0.5
+    
+    def test_coercible_data_falls_back_to_validation(self):
+        item = ActionItem.from_llm({"task": "a", "confidence": "0.8", "source_chunk": "3"})
+        assert item.confidence == 0.8
+        assert item.source_chunk == 3
+    
+    @pytest.mark.parametrize("data", [
+        {"task": "a", "confidence": True},
+        {"task": "a", "confidence": "0.8"},
+        {"task": "a", "source_chunk": 2.0},
+    ])
+    def test_fallback_matches_full_validation(self, data):
+        assert ActionItem.from_llm(data) == ActionItem(**data)
+    
+    @pytest.mark.parametrize("data", [
+        {"task": None},
+        {"owner": "Sam"},
+        {"task": "a", "confidence": 1.5},
+        {"task": "a", "owner": ["Sam", "Al"]},
+        {"task": "a", "deadline": {"date": "Friday"}},
+    ])
+    def test_invalid_data_raises(self, data):
+        with pytest.raises(Exception):
+            ActionItem.from_llm(data)
+    
+    def test_non_dict_raises(self):
+        with pytest.raises(Exception):
+            ActionItem.from_llm(["task", "a"])
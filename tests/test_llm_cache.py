@@ -0,0 +1,114 @@
+"""Tests for the on-disk LLM response cache."""
+
+import asyncio
+from types import SimpleNamespace
+import pytest
+from src import llm_cache
+from src.llm_cache import LLMCache
+
+
+class FakeLLM(SimpleNamespace):
+    """Chat model stand-in that streams its canned response in two pieces."""
+    
+    def stream(self, prompt):
+        self.calls.append(prompt)
+        half = len(self.response) // 2
+        for piece in (self.response[:half], self.response[half:]):
+            yield SimpleNamespace(content=piece)
+
+
+def fake_llm(response="0.8", temperature=0.0, max_tokens=None):
+    return FakeLLM(response=response, temperature=temperature, max_tokens=max_tokens, calls=[])
+
+
+@pytest.fixture(autouse=True)
+def fake_invoke(monkeypatch):
+    """Route invoke/ainvoke through the fake model's canned response."""
+    def invoke(llm, prompt):
+        llm.calls.append(prompt)
+        return SimpleNamespace(content=llm.response)
+    
+    async def ainvoke(llm, prompt):
+        return invoke(llm, prompt)
+    
+    monkeypatch.setattr(llm_cache, "invoke_with_retry", invoke)
+    monkeypatch.setattr(llm_cache, "ainvoke_with_retry", ainvoke)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "cache.jsonl")
+
+
+class TestLLMCache:
+    """Tests for LLMCache."""
+    
+    def test_round_trip_through_file(self, path):
+        llm = fake_llm()
+        assert LLMCache(path=path).invoke(llm, "gpt", "prompt") == "0.8"
+        
+        reloaded = LLMCache(path=path)
+        assert reloaded.invoke(llm, "gpt", "prompt") == "0.8"
+        assert len(llm.calls) == 1
+    
+    def test_models_do_not_share_entries(self, path):
+        cache = LLMCache(path=path)
+        cache.invoke(fake_llm("0.1"), "gpt-a", "prompt")
+        assert cache.invoke(fake_llm("0.2"), "gpt-b", "prompt") == "0.2"
+    
+    def test_sampling_params_are_part_of_key(self, path):
+        cache = LLMCache(path=path)
+        cache.invoke(fake_llm("0.1", temperature=0.0), "gpt", "prompt")
+        assert cache.invoke(fake_llm("0.2", temperature=0.7), "gpt", "prompt") == "0.2"
+        assert cache.invoke(fake_llm("0.3", max_tokens=10), "gpt", "prompt") == "0.3"
+    
+    def test_response_format_is_part_of_key(self, path):
+        cache = LLMCache(path=path)
+        base = fake_llm("[1]")
+        json_mode = SimpleNamespace(bound=fake_llm("{}"), kwargs={"response_format": {"type": "json_object"}})
+        assert cache.model_id(base, "gpt") != cache.model_id(json_mode, "gpt")
+    
+    def test_disabled_never_caches(self, path):
+        llm = fake_llm()
+        cache = LLMCache(path=path, enabled=False)
+        cache.invoke(llm, "gpt", "prompt")
+        cache.invoke(llm, "gpt", "prompt")
+        assert len(llm.calls) == 2
+        assert cache.entries == {}
+    
+    def test_invalid_response_not_cached(self, path):
+        llm = fake_llm("not a number")
+        cache = LLMCache(path=path)
+        valid = lambda text: text.replace(".", "", 1).isdigit()
+        assert cache.invoke(llm, "gpt", "prompt", valid=valid) == "not a number"
+        
+        llm.response = "0.8"
+        assert cache.invoke(llm, "gpt", "prompt", valid=valid) == "0.8"
+        assert cache.invoke(llm, "gpt", "prompt", valid=valid) == "0.8"
+        assert len(llm.calls) == 2
+        assert len(LLMCache(path=path).entries) == 1
+    
+    def test_async_invoke_respects_valid(self, path):
+        llm = fake_llm("oops")
+        cache = LLMCache(path=path)
+        asyncio.run(cache.ainvoke(llm, "gpt", "prompt", valid=lambda text: False))
+        assert cache.entries == {}
+    
+    def test_stream_checked_after_consumption(self, path):
+        llm = fake_llm('[{"task": "a"}]')
+        cache = LLMCache(path=path)
+        assert "".join(cache.stream(llm, "gpt", "prompt", valid=lambda text: False)) == llm.response
+        assert cache.entries == {}
+        
+        assert "".join(cache.stream(llm, "gpt", "prompt")) == llm.response
+        assert list(cache.stream(llm, "gpt", "prompt")) == [llm.response]
+        assert len(llm.calls) == 2
+    
+    @pytest.mark.parametrize("line", ['{"foo": 1}', "[1, 2]", "not json", '{"key": "k"}'])
+    def test_corrupt_lines_skipped(self, path, line):
+        cache = LLMCache(path=path)
+        cache.invoke(fake_llm(), "gpt", "prompt")
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+        
+        assert len(LLMCache(path=path).entries) == 1
@@ -0,0 +1,42 @@
+"""Tests for the end-to-end extraction pipeline."""
+
+import asyncio
+import pytest
+from src.main import ActionItemExtractor
+from src.models import ActionItem, MapPhaseOutput, ReducePhaseOutput
+
+
+@pytest.fixture
+def extractor(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    return ActionItemExtractor()
+
+
+class TestExtract:
+    """Tests for ActionItemExtractor.extract."""
+    
+    def test_llm_phases_share_one_event_loop(self, extractor, monkeypatch):
+        loops = []
+        item = ActionItem(task="Send the budget draft to finance", owner="Sam", deadline="Friday")
+        
+        async def fake_map(chunks):
+            loops.append(asyncio.get_running_loop())
+            return [MapPhaseOutput(items=[item], chunk_index=0, total_chunks=1, processing_time=0)]
+        
+        async def fake_reduce(items):
+            loops.append(asyncio.get_running_loop())
+            return ReducePhaseOutput(items=items, duplicates_removed=0, fields_filled=0, total_processing_time=0)
+        
+        async def fake_score(items):
+            loops.append(asyncio.get_running_loop())
+            return items
+        
+        monkeypatch.setattr(extractor.map_chain, "aextract_batch", fake_map)
+        monkeypatch.setattr(extractor.reduce_chain, "aconsolidate", fake_reduce)
+        monkeypatch.setattr(extractor.confidence_chain, "ascore_items", fake_score)
+        
+        result = extractor.extract("Sam: I'll send the budget draft to finance by Friday.", "meeting.txt")
+        
+        assert [i.task for i in result] == [item.task]
+        assert len(loops) == 3
+        assert loops[0] is loops[1] is loops[2]
@@ -0,0 +1,149 @@
+"""Tests for REDUCE response handling."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+import pytest
+import src.reduce_chain as reduce_chain
+from src.models import ActionItem
+from src.reduce_chain import ReduceChain
+
+
+DUPLICATES = [
+    ActionItem(task="Send the quarterly report to finance", owner="Sam", confidence=0.8),
+    ActionItem(task="Send the quarterly report to the finance team", confidence=0.7),
+]
+SINGLETON = ActionItem(task="Book a room for the offsite", owner="Al", confidence=0.9)
+
+MERGED = '{"task": "Send the quarterly report to the finance team", "owner": "Sam", "confidence": 0.9}'
+
+
+@pytest.fixture
+def chain(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    return ReduceChain(json_mode=False)
+
+
+def consolidate_with_response(chain, monkeypatch, response_text, items):
+    """Run aconsolidate with the LLM call replaced by a canned response."""
+    async def fake_ainvoke(llm, prompt):
+        return SimpleNamespace(content=response_text)
+    
+    monkeypatch.setattr(reduce_chain, "ainvoke_with_retry", fake_ainvoke)
+    return asyncio.run(chain.aconsolidate(items))
+
+
+class TestReduceResponseParsing:
+    """Tests for ReduceChain parsing of LLM consolidation output."""
+    
+    @pytest.mark.parametrize("response_text", [
+        f"[{MERGED}]",
+        f'{{"items": [{MERGED}], "summary": {{"duplicates_removed": 1}}}}',
+        f"Here is the consolidated list:\n```json\n[{MERGED}]\n```\nLet me know [if] you need more.",
+        f'Result:\n{{"items": [{MERGED}]}}\nDone.',
+    ])
+    def test_merged_items_kept(self, chain, monkeypatch, response_text):
+        result = consolidate_with_response(chain, monkeypatch, response_text, DUPLICATES + [SINGLETON])
+        
+        tasks = [item.task for item in result.items]
+        assert tasks == ["Send the quarterly report to the finance team", SINGLETON.task]
+        assert result.items[0].owner == "Sam"
+        assert result.duplicates_removed == 1
+    
+    @pytest.mark.parametrize("response_text", [
+        "I could not consolidate these items.",
+        "[]",
+        '{"summary": {"duplicates_removed": 1}}',
+        '[{"owner": "Sam"}]',
+        '[{"task": "a",',
+    ])
+    def test_unusable_response_keeps_originals(self, chain, monkeypatch, response_text):
+        result = consolidate_with_response(chain, monkeypatch, response_text, DUPLICATES + [SINGLETON])
+        
+        assert [item.task for item in result.items] == [item.task for item in DUPLICATES] + [SINGLETON.task]
+        assert result.duplicates_removed == 0
+
+
+CLUSTERS = {
+    "quarterly": ["Send the quarterly report to finance", "Send the quarterly report to the finance team"],
+    "offsite": ["Book the room for the offsite in May", "Book a room for the offsite in May"],
+    "onboarding": ["Update the onboarding docs for new hires", "Update onboarding docs for the new hires"],
+}
+
+
+def merging_llm(monkeypatch):
+    """Replace the LLM call with one that merges each known cluster present in the prompt."""
+    prompts = []
+    
+    async def fake_ainvoke(llm, prompt):
+        prompts.append(prompt)
+        merged = [{"task": tasks[0], "confidence": 0.9} for key, tasks in CLUSTERS.items() if key in prompt]
+        return SimpleNamespace(content=json.dumps(merged))
+    
+    monkeypatch.setattr(reduce_chain, "ainvoke_with_retry", fake_ainvoke)
+    return prompts
+
+
+def cluster_items():
+    return [ActionItem(task=task) for tasks in CLUSTERS.values() for task in tasks]
+
+
+class TestReduceGrouping:
+    """Tests for splitting REDUCE work into concurrent groups."""
+    
+    def test_oversized_cluster_split(self, monkeypatch):
+        monkeypatch.setattr(reduce_chain, "REDUCE_GROUP_SIZE", 2)
+        big = [ActionItem(task=f"Send the report {i}") for i in range(5)]
+        small = [ActionItem(task="Book a room")]
+        
+        groups = ReduceChain._pack_clusters([big, small])
+        
+        assert [len(group) for group in groups] == [2, 2, 2]
+        assert [item for group in groups for item in group] == big + small
+    
+    def test_groups_merged_in_final_pass(self, chain, monkeypatch):
+        monkeypatch.setattr(reduce_chain, "REDUCE_GROUP_SIZE", 4)
+        prompts = merging_llm(monkeypatch)
+        
+        result = asyncio.run(chain.aconsolidate(cluster_items() + [SINGLETON]))
+        
+        assert len(prompts) == 3
+        assert all(key in prompts[-1] for key in ("quarterly", "offsite", "onboarding"))
+        assert [item.task for item in result.items] == [tasks[0] for tasks in CLUSTERS.values()] + [SINGLETON.task]
+        assert result.duplicates_removed == 3
+    
+    def test_final_pass_skipped_when_too_large(self, chain, monkeypatch):
+        monkeypatch.setattr(reduce_chain, "REDUCE_GROUP_SIZE", 2)
+        prompts = merging_llm(monkeypatch)
+        
+        result = asyncio.run(chain.aconsolidate(cluster_items()))
+        
+        assert len(prompts) == 3
+        assert [item.task for item in result.items] == [tasks[0] for tasks in CLUSTERS.values()]
+        assert result.duplicates_removed == 3
+
+
+class TestJsonMode:
+    """Tests for ReduceChain with response_format=json_object."""
+    
+    @pytest.fixture
+    def json_chain(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        return ReduceChain(json_mode=True)
+    
+    def test_prompt_asks_for_items_object(self, json_chain, monkeypatch):
+        prompts = []
+        
+        async def fake_ainvoke(llm, prompt):
+            prompts.append(prompt)
+            return SimpleNamespace(content=f'{{"items": [{MERGED}], "summary": {{"duplicates_removed": 1}}}}')
+        
+        monkeypatch.setattr(reduce_chain, "ainvoke_with_retry", fake_ainvoke)
+        result = asyncio.run(json_chain.aconsolidate(DUPLICATES + [SINGLETON]))
+        
+        assert '"items": [' in prompts[0]
+        assert [item.task for item in result.items] == ["Send the quarterly report to the finance team", SINGLETON.task]
+        assert result.duplicates_removed == 1
+    
+    def test_default_prompt_unchanged(self, chain):
+        assert chain.output_instruction is None
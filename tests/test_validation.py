@@ -0,0 +1,106 @@
+"""Tests for validation and edge case handling."""
+
+import pytest
+from src.models import ActionItem, DeadlineKind, OwnerKind, classify_deadline, classify_owner
+from src.validation import ValidationLayer
+
+
+@pytest.fixture
+def validator():
+    return ValidationLayer(confidence_threshold=0.4)
+
+
+class TestValidateItem:
+    """Tests for ValidationLayer.validate_item."""
+    
+    @pytest.mark.parametrize("task", ["Do some stuff", "Fix the THING", "Whatever Sam wants"])
+    def test_vague_task_matched_case_insensitively(self, validator, task):
+        assert validator.validate_item(ActionItem(task=task, confidence=0.9)) == (False, "Task description is too vague")
+    
+    def test_valid_item(self, validator):
+        assert validator.validate_item(ActionItem(task="Send the report", confidence=0.9)) == (True, "Valid")
+    
+    def test_low_confidence(self, validator):
+        assert validator.validate_item(ActionItem(task="Send the report", confidence=0.2)) == (
+            False, "Confidence too low (0.2 < 0.4)"
+        )
+    
+    def test_threshold_is_read_only(self, validator):
+        with pytest.raises(AttributeError):
+            validator.confidence_threshold = 0.9
+        
+        assert validator.confidence_threshold == 0.4
+        assert validator.validate_item(ActionItem(task="Send the report", confidence=0.5)) == (True, "Valid")
+    
+    @pytest.mark.parametrize("task", ["", "   "])
+    def test_empty_task(self, validator, task):
+        assert validator.validate_item(ActionItem(task=task, confidence=0.9)) == (False, "Task is empty")
+
+
+class TestClassifyDeadline:
+    """Tests for deadline classification."""
+    
+    @pytest.mark.parametrize("deadline", ["ASAP", "asap", "Soon", "when possible", "This Week"])
+    def test_vague_matched_case_insensitively(self, deadline):
+        assert classify_deadline(deadline) is DeadlineKind.VAGUE
+    
+    @pytest.mark.parametrize("deadline", [None, "", "  ", "Not specified"])
+    def test_unspecified(self, deadline):
+        assert classify_deadline(deadline) is DeadlineKind.UNSPECIFIED
+    
+    def test_specific(self):
+        assert classify_deadline("2024-02-15") is DeadlineKind.SPECIFIC
+
+
+class TestClassifyOwner:
+    """Tests for owner classification."""
+    
+    @pytest.mark.parametrize("owner, kind", [
+        ("Unassigned", OwnerKind.UNASSIGNED),
+        ("", OwnerKind.UNASSIGNED),
+        ("   ", OwnerKind.UNASSIGNED),
+        ("Sam", OwnerKind.NAMED),
+        ("Sam AND Al", OwnerKind.MULTIPLE),
+        ("Sam, and Al", OwnerKind.NAMED),
+    ])
+    def test_kinds(self, owner, kind):
+        assert classify_owner(owner) is kind
+
+
+class TestProcessBatch:
+    """Tests for the fused validate + edge case pass."""
+    
+    @staticmethod
+    def make_items():
+        return [
+            ActionItem(task="Send the report", owner="", deadline="ASAP", confidence=0.9),
+            ActionItem(task="Do some stuff", confidence=0.9),
+            ActionItem(task="Book a room", owner="Sam and Al", deadline="Friday", confidence=0.8),
+            ActionItem(task="Maybe refactor", confidence=0.1),
+            ActionItem(task="Plan the offsite", owner="Al", notes="", confidence=0.7),
+        ]
+    
+    def test_matches_validate_then_edge_cases(self, validator):
+        expected_valid, expected_invalid = validator.validate_batch(self.make_items())
+        expected_valid = validator.handle_edge_cases(expected_valid)
+        
+        valid, invalid = validator.process_batch(self.make_items())
+        
+        assert valid == expected_valid
+        assert invalid == expected_invalid
+    
+    def test_defaults_and_markers_applied(self, validator):
+        valid, invalid = validator.process_batch(self.make_items())
+        
+        assert [item.task for item in valid] == ["Send the report", "Book a room", "Plan the offsite"]
+        assert [item.task for item in invalid] == ["Do some stuff", "Maybe refactor"]
+        assert valid[0].owner == "Unassigned"
+        assert valid[0].notes == " [DEADLINE NEEDS CLARIFICATION]"
+        assert valid[2].deadline == "Not specified"
+        assert valid[2].notes is None
+    
+    def test_deadline_marker_added_once(self, validator):
+        valid, _ = validator.process_batch(self.make_items())
+        validator.handle_edge_cases(valid)
+        
+        assert valid[0].notes == " [DEADLINE NEEDS CLARIFICATION]"